@@ -7,79 +7,118 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
+import os
+import queue
 import sys
 import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from tkinter import ttk, messagebox, scrolledtext
+from typing import TYPE_CHECKING, Dict, Optional
+
+import httpx
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from src.crawler.nuri import CrawlConfig, crawl_once
-from src.utils.paths import ensure_dir, workspace_root
+from src.utils.eventloop import install_fast_event_loop
+from src.utils.paths import ensure_dir, jsonl_basename, workspace_root
+
+if TYPE_CHECKING:
+    # Playwright까지 끌고 오는 크롤러 모듈은 실제 사용 시점에 임포트 (UI 첫 화면 지연 방지)
+    from src.crawler.nuri import CrawlConfig, SharedBrowser
 
 BASE_URL = "https://nuri.g2b.go.kr/"
+# 로그 창: 50ms마다 큐를 비워 한 번에 그리고, 최근 1000줄만 유지
+LOG_DRAIN_MS = 50
+LOG_DRAIN_MAX = 500
+LOG_MAX_LINES = 1000
+# 출력 파일명 기본값용 날짜 (UI 실행 시 한 번만 계산)
+TODAY_UTC = datetime.now(timezone.utc).strftime("%Y%m%d")
+
+# URL 체크 반복 시 TCP/TLS 핸드셰이크를 재사용하도록 keep-alive 클라이언트를 공유
+_HTTP = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    headers={"User-Agent": "Mozilla/5.0"},
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+)
+atexit.register(_HTTP.close)
 
 
 def load_config() -> CrawlConfig:
+    """설정 로드. 파일 수정시각(mtime)이 같으면 이전에 파싱한 설정을 재사용 (load_cfg 캐시)."""
+    from src.crawler.nuri import load_cfg
+
+    return load_cfg(workspace_root() / "configs" / "default.json")
+
+
+def prepare_dirs() -> Dict[str, str]:
+    """출력/상태 디렉터리 생성. 이후 파일 경로는 문자열로 조립하므로 str로 반환."""
     root = workspace_root()
-    cfg_path = root / "configs" / "default.json"
-    cfg_dict = json.loads(cfg_path.read_text(encoding="utf-8"))
-    return CrawlConfig.from_dict(cfg_dict)
+    data_dir = ensure_dir(root / "data")
+    return {
+        "raw": os.fspath(ensure_dir(data_dir / "raw")),
+        "normalized": os.fspath(ensure_dir(data_dir / "normalized")),
+        "errors": os.fspath(ensure_dir(data_dir / "errors")),
+        "state": os.fspath(ensure_dir(root / "state")),
+    }
+
+
+def _is_valid_max_items_input(s: str) -> bool:
+    """추출 건수 입력 검증 (키 입력 단위): 빈 값(입력 중) 또는 1~100 정수만 허용."""
+    return s == "" or (s.isascii() and s.isdigit() and 1 <= int(s) <= 100)
 
 
 def check_url() -> tuple[bool, str]:
     """URL 접속 가능 여부 확인."""
     try:
-        import urllib.request
-
-        req = urllib.request.Request(BASE_URL, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if 200 <= resp.status < 400:
-                return True, f"정상 (HTTP {resp.status})"
-            return False, f"HTTP {resp.status}"
+        resp = _HTTP.head(BASE_URL, follow_redirects=True)
+        if resp.status_code == 405:
+            resp = _HTTP.get(BASE_URL, follow_redirects=True)
+        if 200 <= resp.status_code < 400:
+            return True, f"정상 (HTTP {resp.status_code})"
+        return False, f"HTTP {resp.status_code}"
     except Exception as e:
         return False, str(e)
 
 
-def run_crawl(
+async def run_crawl_async(
     max_items: int,
     list_only: bool,
     log_callback,
     raw_name: str,
     normalized_name: str,
+    dirs: Dict[str, str],
+    shared: SharedBrowser,
 ):
-    """크롤링 실행."""
-    root = workspace_root()
+    """크롤링 실행 (App의 백그라운드 이벤트 루프에서 실행)."""
+    from src.crawler.nuri import crawl_once
+
     cfg = load_config()
-    data_dir = ensure_dir(root / "data")
-    raw_dir = ensure_dir(data_dir / "raw")
-    norm_dir = ensure_dir(data_dir / "normalized")
-    errors_dir = ensure_dir(data_dir / "errors")
-    state_dir = ensure_dir(root / "state")
+    raw_dir = dirs["raw"]
+    norm_dir = dirs["normalized"]
+    errors_dir = dirs["errors"]
+    state_dir = dirs["state"]
     run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-
-    def _base(s: str, default: str) -> str:
-        s = s.strip()
-        if not s:
-            return default
-        if s.lower().endswith(".jsonl"):
-            return s[:-6]  # strip .jsonl
-        return s
-
-    raw_base = _base(raw_name, f"list_{run_id[:8]}")
-    norm_base = _base(normalized_name, f"list_{run_id[:8]}_상세")
-    out_raw_list = raw_dir / f"{raw_base}.jsonl"
-    out_normalized = norm_dir / f"{norm_base}.jsonl"
+    date8 = run_id[:8]
+
+    raw_base = jsonl_basename(raw_name, f"list_{date8}")
+    norm_base = jsonl_basename(normalized_name, f"list_{date8}_상세")
+    raw_file = f"{raw_base}.jsonl"
+    norm_file = f"{norm_base}.jsonl"
+    out_raw_list = os.path.join(raw_dir, raw_file)
+    out_normalized = os.path.join(norm_dir, norm_file)
     # 출력 파일마다 별도 state 사용 (이전 state가 새 normalized를 건너뛰지 않도록)
-    state_db = state_dir / f"state_{norm_base}.sqlite"
+    state_db = os.path.join(state_dir, f"state_{norm_base}.sqlite")
+    state_file = os.path.join(state_dir, "browser_state.json")
 
-    log_callback(f"출력: raw={out_raw_list.name}, normalized={out_normalized.name}")
+    log_callback(f"출력: raw={raw_file}, normalized={norm_file}")
 
-    asyncio.run(
-        crawl_once(
+    try:
+        await crawl_once(
             cfg=cfg,
             run_id=run_id,
             out_raw_list=out_raw_list,
@@ -92,9 +131,13 @@ def run_crawl(
             keywords=[],
             list_only=list_only,
             debug_slowmo_ms=0,
+            browser=await shared.get(),
+            state_file=state_file,
         )
-    )
-    log_callback(f"완료: raw={out_raw_list.name}, normalized={out_normalized.name}")
+    except Exception:
+        await shared.reset()
+        raise
+    log_callback(f"완료: raw={raw_file}, normalized={norm_file}")
 
 
 class App(tk.Tk):
@@ -104,6 +147,16 @@ class App(tk.Tk):
         self.geometry("520x440")
         self.resizable(True, True)
 
+        # 크롤링용 이벤트 루프를 전용 스레드에서 한 번만 띄워 여러 번의 실행에 재사용
+        install_fast_event_loop()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._dirs = prepare_dirs()
+        # 실행 간 재사용하는 브라우저 (백그라운드 루프에서만 접근, 첫 크롤링 때 생성)
+        self._browser: Optional[SharedBrowser] = None
+        # URL 체크 등 블로킹 I/O는 Tk 메인 스레드 밖에서 실행
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
         main = ttk.Frame(self, padding=12)
         main.pack(fill=tk.BOTH, expand=True)
 
@@ -115,7 +168,8 @@ class App(tk.Tk):
         # URL 체크
         row1 = ttk.Frame(main)
         row1.pack(fill=tk.X, pady=4)
-        ttk.Button(row1, text="URL 체크", command=self._on_url_check).pack(side=tk.LEFT, padx=(0, 8))
+        self.url_check_button = ttk.Button(row1, text="URL 체크", command=self._on_url_check)
+        self.url_check_button.pack(side=tk.LEFT, padx=(0, 8))
         self.url_label = ttk.Label(row1, text="", foreground="gray")
         self.url_label.pack(side=tk.LEFT)
         ttk.Label(row1, text="nuri.g2b.go.kr 정상 작동 여부 확인").pack(side=tk.LEFT, padx=(16, 0))
@@ -123,19 +177,18 @@ class App(tk.Tk):
         ttk.Separator(main, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=8)
 
         # 출력 파일명
-        date_str = datetime.now(timezone.utc).strftime("%Y%m%d")
         ttk.Label(main, text="출력 파일명 (비우면 기본값 사용)", font=("", 11)).pack(
             anchor=tk.W, pady=(0, 4)
         )
         row_fn = ttk.Frame(main)
         row_fn.pack(fill=tk.X, pady=4)
         ttk.Label(row_fn, text="Raw 목록:").pack(side=tk.LEFT, padx=(0, 4))
-        self.raw_name_var = tk.StringVar(value=f"list_{date_str}")
+        self.raw_name_var = tk.StringVar(value=f"list_{TODAY_UTC}")
         ttk.Entry(row_fn, textvariable=self.raw_name_var, width=24).pack(
             side=tk.LEFT, padx=(0, 16)
         )
         ttk.Label(row_fn, text="정규화:").pack(side=tk.LEFT, padx=(0, 4))
-        self.normalized_name_var = tk.StringVar(value=f"list_{date_str}_상세")
+        self.normalized_name_var = tk.StringVar(value=f"list_{TODAY_UTC}_상세")
         ttk.Entry(row_fn, textvariable=self.normalized_name_var, width=24).pack(
             side=tk.LEFT
         )
@@ -150,9 +203,17 @@ class App(tk.Tk):
         row2 = ttk.Frame(main)
         row2.pack(fill=tk.X, pady=4)
         ttk.Label(row2, text="추출 건수:").pack(side=tk.LEFT, padx=(0, 4))
-        self.max_items_spinbox = tk.Spinbox(row2, from_=1, to=100, width=5)
-        self.max_items_spinbox.delete(0, tk.END)
-        self.max_items_spinbox.insert(0, "10")
+        self.max_items_var = tk.StringVar(value="10")
+        self.max_items_spinbox = ttk.Spinbox(
+            row2,
+            from_=1,
+            to=100,
+            increment=1,
+            width=5,
+            textvariable=self.max_items_var,
+            validate="key",
+            validatecommand=(self.register(_is_valid_max_items_input), "%P"),
+        )
         self.max_items_spinbox.pack(side=tk.LEFT, padx=(0, 16))
         self.list_only_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(
@@ -161,9 +222,9 @@ class App(tk.Tk):
 
         row3 = ttk.Frame(main)
         row3.pack(fill=tk.X, pady=8)
-        ttk.Button(
-            row3, text="입찰공고목록 추출", command=self._on_crawl
-        ).pack(side=tk.LEFT)
+        # 실행 중에는 비활성화: 같은 SharedBrowser를 쓰는 크롤링이 겹치지 않게 (실패 시 reset이 다른 실행의 브라우저를 닫음)
+        self.crawl_button = ttk.Button(row3, text="입찰공고목록 추출", command=self._on_crawl)
+        self.crawl_button.pack(side=tk.LEFT)
 
         ttk.Separator(main, orient=tk.HORIZONTAL).pack(fill=tk.X, pady=8)
 
@@ -178,14 +239,72 @@ class App(tk.Tk):
             anchor=tk.W
         )
 
+        self._log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
+        # 첫 화면을 그린 뒤 연결/브라우저 예열
+        self.after_idle(self._warm_up)
+
+    def _warm_up(self) -> None:
+        """
+        첫 URL 체크/크롤링의 콜드 스타트 비용을 미리 지불.
+        - DNS + TCP + TLS 연결을 keep-alive 풀에 올려 둠 (결과는 무시)
+        - 백그라운드 루프에서 Playwright 임포트 + Chromium 기동
+        """
+        self._executor.submit(_HTTP.head, BASE_URL)
+
+        async def _launch() -> None:
+            try:
+                await (await self._shared_browser()).get()
+            except Exception as e:
+                self._log(f"[예열] 브라우저 실행 실패 (크롤링 시 다시 시도): {e}")
+
+        asyncio.run_coroutine_threadsafe(_launch(), self._loop)
+
+    def shutdown(self) -> None:
+        """창 종료 후 브라우저/이벤트 루프 정리."""
+        if self._browser is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._browser.close(), self._loop).result(timeout=10)
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._executor.shutdown(wait=False)
+
+    async def _shared_browser(self) -> SharedBrowser:
+        if self._browser is None:
+            from src.crawler.nuri import SharedBrowser
+
+            self._browser = SharedBrowser(headless=True)
+        return self._browser
+
     def _log(self, msg: str) -> None:
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, msg + "\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        # 어느 스레드에서든 호출 가능: 실제 출력은 _drain_log_queue가 메인 스레드에서 처리
+        self._log_queue.put(msg)
+
+    def _drain_log_queue(self) -> None:
+        lines = []
+        try:
+            while len(lines) < LOG_DRAIN_MAX:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.delete("1.0", f"end-{LOG_MAX_LINES}l")
+            self.log_text.see(tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+        self.after(LOG_DRAIN_MS, self._drain_log_queue)
 
     def _on_url_check(self) -> None:
-        ok, msg = check_url()
+        self.url_check_button.configure(state=tk.DISABLED)
+        self.url_label.configure(text="확인 중...", foreground="gray")
+        fut = self._executor.submit(check_url)
+        fut.add_done_callback(lambda f: self.after(0, lambda: self._apply_url_result(f.result())))
+
+    def _apply_url_result(self, result: tuple[bool, str]) -> None:
+        self.url_check_button.configure(state=tk.NORMAL)
+        ok, msg = result
         if ok:
             self.url_label.configure(text=f"정상: {msg}", foreground="green")
             self._log(f"[URL 체크] {BASE_URL} {msg}")
@@ -195,36 +314,42 @@ class App(tk.Tk):
 
     def _on_crawl(self) -> None:
         # 메인 스레드에서 UI 값 캡처 (Tkinter 스레드 안전)
-        try:
-            max_items = min(100, max(1, int(self.max_items_spinbox.get())))
-        except (ValueError, tk.TclError):
+        # 키 입력 검증으로 값은 항상 빈 문자열 또는 1~100 정수
+        max_items_text = self.max_items_var.get()
+        if not max_items_text:
             messagebox.showerror("오류", "추출 건수는 1~100 사이의 숫자를 입력하세요.")
             return
+        max_items = int(max_items_text)
         list_only = self.list_only_var.get()
         raw_name = self.raw_name_var.get()
         normalized_name = self.normalized_name_var.get()
 
-        def _thread_safe_log(msg: str) -> None:
-            self.after(0, lambda: self._log(msg))
-
-        def _run():
-            try:
-                _thread_safe_log("[크롤링 시작] 브라우저 실행 중...")
-                run_crawl(
-                    max_items, list_only, _thread_safe_log,
-                    raw_name=raw_name, normalized_name=normalized_name,
-                )
-                self.after(0, lambda: messagebox.showinfo("완료", "크롤링이 완료되었습니다."))
-            except Exception as e:
-                self.after(0, lambda: messagebox.showerror("오류", str(e)))
+        def _done(fut) -> None:
+            self.crawl_button.configure(state=tk.NORMAL)
+            e = fut.exception()
+            if e is None:
+                messagebox.showinfo("완료", "크롤링이 완료되었습니다.")
+            else:
                 self._log(f"[오류] {e}")
+                messagebox.showerror("오류", str(e))
+
+        async def _crawl() -> None:
+            await run_crawl_async(
+                max_items, list_only, self._log,
+                raw_name=raw_name, normalized_name=normalized_name,
+                dirs=self._dirs, shared=await self._shared_browser(),
+            )
 
-        threading.Thread(target=_run, daemon=True).start()
+        self.crawl_button.configure(state=tk.DISABLED)
+        self._log("[크롤링 시작] 브라우저 실행 중...")
+        fut = asyncio.run_coroutine_threadsafe(_crawl(), self._loop)
+        fut.add_done_callback(lambda f: self.after(0, lambda: _done(f)))
 
 
 def main():
     app = App()
     app.mainloop()
+    app.shutdown()
 
 
 if __name__ == "__main__":
@@ -66,9 +66,12 @@ async def test_from_live(config_path: Path, max_items: int, headed: bool) -> Non
             await browser.close()
             return
 
-        await _open_detail(page, items[0])
-        await page.wait_for_timeout(2000)
-        result = await extract_detail_kv(page, cfg)
+        # 상세가 popup(새 탭)으로 열리면 그 탭에서 추출
+        detail = await _open_detail(page, items[0])
+        await detail.wait_for_timeout(2000)
+        result = await extract_detail_kv(detail, cfg)
+        if detail is not page:
+            await detail.close()
 
         print(json.dumps(result, ensure_ascii=False, indent=2))
         await browser.close()
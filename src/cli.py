@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import dataclasses
 import logging
-import time
+import os
+import signal
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence
 
-from src.crawler.nuri import CrawlConfig, crawl_once
+import orjson
+
+from src.crawler.nuri import CrawlConfig, SharedBrowser, crawl_once
+from src.utils.eventloop import install_fast_event_loop
 from src.utils.logging import setup_logging
-from src.utils.paths import ensure_dir, workspace_root
+from src.utils.paths import ensure_dir, jsonl_basename, workspace_root
 
 
 log = logging.getLogger("nuri.cli")
@@ -21,10 +27,11 @@ def utc_run_id() -> str:
 
 
 def load_config(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
 
 
-def parse_args() -> argparse.Namespace:
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="누리장터 입찰공고 크롤러")
     p.add_argument("--config", default="configs/default.json")
     p.add_argument("--mode", choices=["once", "interval"], default="once")
@@ -37,29 +44,49 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--max-items", type=int, default=30)
     p.add_argument("--list-only", action="store_true", help="목록만 수집하고 상세는 생략")
     p.add_argument("--keyword", action="append", default=[], help="포함 키워드(복수 가능)")
+    p.add_argument("--raw-name", default="", help="목록 출력 파일명 (기본 list_YYYYMMDD)")
+    p.add_argument("--normalized-name", default="", help="상세 출력 파일명 (기본 notices)")
+    p.add_argument("--flush-every", type=int, default=None, help="JSONL 기록 묶음 크기(건, 기본 200)")
+    p.add_argument(
+        "--flush-interval-sec", type=float, default=None, help="JSONL 최대 기록 간격(초, 기본 5)"
+    )
     p.add_argument("--log-level", default="INFO")
-    return p.parse_args()
+    return p
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
 
 
 def main() -> None:
     args = parse_args()
     setup_logging(args.log_level)
+    install_fast_event_loop()
 
     root = workspace_root()
     cfg_path = (root / args.config).resolve()
     cfg_dict = load_config(cfg_path)
     cfg = CrawlConfig.from_dict(cfg_dict)
+    if args.flush_every is not None:
+        cfg = dataclasses.replace(cfg, flush_every=args.flush_every)
+    if args.flush_interval_sec is not None:
+        cfg = dataclasses.replace(cfg, flush_interval_sec=args.flush_interval_sec)
 
+    # Path는 경계에서만 쓰고, 이후 경로는 문자열로 조립
     data_dir = ensure_dir(root / "data")
-    raw_dir = ensure_dir(data_dir / "raw")
-    norm_dir = ensure_dir(data_dir / "normalized")
-    errors_dir = ensure_dir(data_dir / "errors")
-    state_dir = ensure_dir(root / "state")
+    raw_dir = os.fspath(ensure_dir(data_dir / "raw"))
+    norm_dir = os.fspath(ensure_dir(data_dir / "normalized"))
+    errors_dir = os.fspath(ensure_dir(data_dir / "errors"))
+    state_dir = os.fspath(ensure_dir(root / "state"))
 
     run_id = utc_run_id()
-    out_raw_list = raw_dir / f"list_{run_id[:8]}.jsonl"
-    out_normalized = norm_dir / "notices.jsonl"
-    state_db = state_dir / "state.sqlite"
+    date8 = run_id[:8]
+    raw_base = jsonl_basename(args.raw_name, f"list_{date8}")
+    norm_base = jsonl_basename(args.normalized_name, "notices")
+    out_raw_list = os.path.join(raw_dir, f"{raw_base}.jsonl")
+    out_normalized = os.path.join(norm_dir, f"{norm_base}.jsonl")
+    state_db = os.path.join(state_dir, "state.sqlite")
+    state_file = os.path.join(state_dir, "browser_state.json")
 
     keywords: List[str] = []
     keywords.extend(cfg_dict.get("filters", {}).get("keywords", []) or [])
@@ -69,36 +96,69 @@ def main() -> None:
     headless = not headed
     slowmo = args.slowmo_ms if headed else 0
 
-    def _run_once():
-        import asyncio
-
-        asyncio.run(
-            crawl_once(
-                cfg=cfg,
-                run_id=run_id,
-                out_raw_list=out_raw_list,
-                out_normalized=out_normalized,
-                errors_dir=errors_dir,
-                state_db=state_db,
-                headless=headless,
-                max_pages=args.max_pages,
-                max_items=args.max_items,
-                keywords=keywords,
-                list_only=bool(args.list_only),
-                debug_slowmo_ms=slowmo,
-            )
+    async def _run_once(browser=None) -> None:
+        await crawl_once(
+            cfg=cfg,
+            run_id=run_id,
+            out_raw_list=out_raw_list,
+            out_normalized=out_normalized,
+            errors_dir=errors_dir,
+            state_db=state_db,
+            headless=headless,
+            max_pages=args.max_pages,
+            max_items=args.max_items,
+            keywords=keywords,
+            list_only=bool(args.list_only),
+            debug_slowmo_ms=slowmo,
+            browser=browser,
+            state_file=state_file,
         )
 
     if args.mode == "once":
-        _run_once()
+        asyncio.run(_run_once())
         return
 
-    while True:
+    async def _interval_main() -> None:
+        # 하나의 이벤트 루프 + 브라우저를 회차 간 재사용 (Chromium 기동 비용 제거)
+        shared = SharedBrowser(headless=headless, debug_slowmo_ms=slowmo)
+        stop = asyncio.Event()
+        main_task = asyncio.current_task()
+
+        def _request_stop() -> None:
+            if stop.is_set():
+                # 두 번째 신호: 진행 중인 회차도 즉시 중단
+                main_task.cancel()
+                return
+            log.info("종료 요청: 진행 중인 회차가 끝나면 종료 (한 번 더 누르면 즉시 중단)")
+            stop.set()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, _request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows 등 미지원 환경: KeyboardInterrupt로 종료
+                pass
+
         try:
-            _run_once()
-        except Exception:
-            log.exception("interval run failed")
-        time.sleep(max(args.interval_min, 1) * 60)
+            while not stop.is_set():
+                try:
+                    await _run_once(await shared.get())
+                except Exception:
+                    log.exception("interval run failed")
+                    await shared.reset()
+                # 대기 중에도 종료 요청이 오면 바로 깨어남
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=max(args.interval_min, 1) * 60)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await shared.close()
+
+    try:
+        asyncio.run(_interval_main())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        log.info("interval 모드 중단")
 
 
 if __name__ == "__main__":
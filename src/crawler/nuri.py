@@ -1,20 +1,42 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
 import re
+import sys
 import time
+import traceback
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from playwright.async_api import Page, async_playwright
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+import orjson
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Locator,
+    Page,
+    Playwright,
+    Response,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.models import ListItem, NoticeRecord, SourceMeta
-from src.storage.jsonl import JsonlWriter
+from src.storage.jsonl import AsyncJsonlWriter, QueuedJsonlWriter
 from src.storage.state import StateStore, sha256_text
-from src.utils.retry import default_retry
+from src.utils.paths import StrPath
+from src.utils.retry import TRANSIENT_EXC, default_retry
+
+if TYPE_CHECKING:
+    import httpx
 
 log = logging.getLogger("nuri.crawler")
 
@@ -23,54 +45,121 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+_SAFE_FN_RE = re.compile(r"[^0-9A-Za-z._-]+")
+# str.split()과 같은 (유니코드 포함) 공백 기준
+_WS_RE = re.compile(r"\s+")
+# 목록 행 innerText의 셀 구분(탭/줄바꿈)
+_SPLIT_RE = re.compile(r"[\t\n]+")
+
+
 def safe_filename(s: str) -> str:
-    return re.sub(r"[^0-9A-Za-z._-]+", "_", s)[:180]
+    return _SAFE_FN_RE.sub("_", s)[:180]
+
+
+def _str_tuple(v: Any) -> Tuple[str, ...]:
+    return tuple(v or ())
 
 
-@dataclass
+def _readonly_str_map(d: Any) -> Mapping[str, Any]:
+    return MappingProxyType(dict(d)) if isinstance(d, dict) else MappingProxyType({})
+
+
+def _readonly_list_map(d: Any) -> Mapping[str, Tuple[str, ...]]:
+    if not isinstance(d, dict):
+        return MappingProxyType({})
+    return MappingProxyType({k: _str_tuple(v) for k, v in d.items()})
+
+
+@dataclass(frozen=True)
 class CrawlConfig:
+    """
+    크롤 설정. 생성 후 바뀌지 않으므로 목록은 tuple, 매핑은 읽기 전용(MappingProxyType)으로 보관해
+    회차/상세마다 복사하지 않고 그대로 참조한다. (page.evaluate 인자로는 tuple도 배열로 전달됨)
+    """
+
     base_url: str
     search_button_text: Optional[str]
     search_button_selector: Optional[str]
-    bid_list_ready_selectors: List[str]
-    list_columns: List[str]
-    row_selector_candidates: List[str]
-    link_selector_candidates: List[str]
-    next_button_name_candidates: List[str]
-    next_button_selector_candidates: List[str]
-    detail_ready_selectors: List[str]
-    detail_sections: List[str]
-    detail_table_sections: List[str]
-    detail_field_sections: Dict[str, List[str]]
-    detail_table_columns: Dict[str, List[str]]
-    mega_menu: Optional[Dict[str, str]] = None
+    bid_list_ready_selectors: Tuple[str, ...]
+    list_columns: Tuple[str, ...]
+    row_selector_candidates: Tuple[str, ...]
+    link_selector_candidates: Tuple[str, ...]
+    next_button_name_candidates: Tuple[str, ...]
+    next_button_selector_candidates: Tuple[str, ...]
+    detail_ready_selectors: Tuple[str, ...]
+    detail_sections: Tuple[str, ...]
+    detail_table_sections: Tuple[str, ...]
+    detail_field_sections: Mapping[str, Tuple[str, ...]]
+    detail_table_columns: Mapping[str, Tuple[str, ...]]
+    mega_menu: Optional[Mapping[str, str]] = None
+    # 스타일시트는 메가메뉴 hover/표시 판정에 필요해 기본 차단 대상에서 제외
+    block_resource_types: Tuple[str, ...] = ("image", "font", "media")
+    inline_detail_selector: Optional[str] = None
+    detail_concurrency: int = 8
+    # True면 상세 하나라도 실패 시 기록 후 실행 중단 (기본: 실패 항목만 error로 남기고 계속)
+    hard_fail: bool = False
+    # "browser": 상세 URL을 탭에서 이동해 수집 / "http": httpx로 HTML만 받아 탭에 넣고 추출
+    # (JS 렌더가 필요한 상세면 자동으로 browser 방식으로 대체)
+    detail_mode: str = "browser"
+    flush_every: int = 200
+    flush_interval_sec: float = 5.0
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "CrawlConfig":
         nav = d.get("navigation", {})
         lst = d.get("list", {})
         det = d.get("detail", {})
+        out = d.get("output", {})
         mega = nav.get("mega_menu")
         return CrawlConfig(
             base_url=d.get("base_url", "https://nuri.g2b.go.kr/"),
             search_button_text=nav.get("search_button_text"),
             search_button_selector=nav.get("search_button_selector"),
-            bid_list_ready_selectors=list(nav.get("bid_list_ready_selectors", ["tbody tr"])),
-            list_columns=list(lst.get("columns", [])),
-            row_selector_candidates=list(lst.get("row_selector_candidates", ["tbody tr"])),
-            link_selector_candidates=list(lst.get("link_selector_candidates", ["a"])),
-            next_button_name_candidates=list(lst.get("next_button_name_candidates", ["다음", ">"])),
-            next_button_selector_candidates=list(lst.get("next_button_selector_candidates", [])),
-            detail_ready_selectors=list(det.get("ready_selectors", ["body"])),
-            detail_sections=list(det.get("sections", [])),
-            detail_table_sections=list(det.get("table_sections", [])),
-            detail_field_sections=dict(det.get("field_sections", {}) or {}),
-            detail_table_columns=dict(det.get("table_columns", {}) or {}),
-            mega_menu=dict(mega) if isinstance(mega, dict) else None,
+            bid_list_ready_selectors=_str_tuple(nav.get("bid_list_ready_selectors", ["tbody tr"])),
+            list_columns=_str_tuple(lst.get("columns")),
+            row_selector_candidates=_str_tuple(lst.get("row_selector_candidates", ["tbody tr"])),
+            link_selector_candidates=_str_tuple(lst.get("link_selector_candidates", ["a"])),
+            next_button_name_candidates=_str_tuple(lst.get("next_button_name_candidates", ["다음", ">"])),
+            next_button_selector_candidates=_str_tuple(lst.get("next_button_selector_candidates")),
+            detail_ready_selectors=_str_tuple(det.get("ready_selectors", ["body"])),
+            detail_sections=_str_tuple(det.get("sections")),
+            detail_table_sections=_str_tuple(det.get("table_sections")),
+            detail_field_sections=_readonly_list_map(det.get("field_sections")),
+            detail_table_columns=_readonly_list_map(det.get("table_columns")),
+            mega_menu=_readonly_str_map(mega) if isinstance(mega, dict) else None,
+            block_resource_types=_str_tuple(nav.get("block_resource_types", ["image", "font", "media"])),
+            inline_detail_selector=lst.get("inline_detail_selector") or None,
+            detail_concurrency=int(det.get("concurrency", 8)),
+            hard_fail=bool(det.get("hard_fail", False)),
+            detail_mode=str(det.get("mode", "browser")),
+            flush_every=int(out.get("flush_every", 200)),
+            flush_interval_sec=float(out.get("flush_interval_sec", 5.0)),
         )
 
 
-async def _wait_any_selector(page: Page, selectors: List[str], timeout_ms: int) -> str:
+@lru_cache(maxsize=8)
+def _load_cfg_cached(path: str, mtime_ns: int) -> CrawlConfig:
+    return CrawlConfig.from_dict(orjson.loads(Path(path).read_bytes()))
+
+
+def load_cfg(path: StrPath) -> CrawlConfig:
+    """
+    설정 파일(JSON)을 읽어 CrawlConfig로 변환 (orjson 파싱).
+    - (절대경로, 수정시각) 기준으로 캐시: 파일이 그대로면 다시 파싱하지 않고, 고치면 새로 읽는다.
+    - CrawlConfig는 불변이므로 같은 객체를 여러 곳에서 공유해도 된다.
+    """
+    abs_path = os.path.abspath(os.fspath(path))
+    return _load_cfg_cached(abs_path, os.stat(abs_path).st_mtime_ns)
+
+
+class ElementNotFoundError(LookupError):
+    """
+    후보 셀렉터/텍스트를 모두 시도해도 요소를 찾지 못함.
+    - 대부분 설정(셀렉터, 메뉴 문구) 문제라 재시도 대상(TRANSIENT_EXC)이 아니다: 백오프 없이 바로 실패.
+    """
+
+
+async def _wait_any_selector(page: Page, selectors: Sequence[str], timeout_ms: int) -> str:
     last_err: Optional[Exception] = None
     for sel in selectors:
         try:
@@ -78,7 +167,74 @@ async def _wait_any_selector(page: Page, selectors: List[str], timeout_ms: int)
             return sel
         except Exception as e:
             last_err = e
-    raise RuntimeError(f"ready selector not found: {selectors}") from last_err
+    raise ElementNotFoundError(f"ready selector not found: {selectors}") from last_err
+
+
+_FIRST_ROW_TEXT_JS = """
+(sels) => {
+    for (const s of sels) {
+        let r = null;
+        try { r = document.querySelector(s); } catch (e) { continue; }
+        if (r) return (r.innerText || '').trim();
+    }
+    return null;
+}
+"""
+
+# before가 null이면 행이 처음 나타날 때, 아니면 첫 행 텍스트가 바뀔 때 true
+_ROWS_CHANGED_JS = """
+([sels, before]) => {
+    for (const s of sels) {
+        let r = null;
+        try { r = document.querySelector(s); } catch (e) { continue; }
+        if (r) {
+            const t = (r.innerText || '').trim();
+            return before === null ? t.length > 0 : t !== before;
+        }
+    }
+    return false;
+}
+"""
+
+
+async def _first_row_text(page: Page, cfg: CrawlConfig) -> Optional[str]:
+    try:
+        return await page.evaluate(_FIRST_ROW_TEXT_JS, cfg.row_selector_candidates)
+    except PlaywrightError:
+        # 화면 전환 중(실행 컨텍스트 교체)이면 '아직 행 없음'으로 취급
+        return None
+
+
+async def _wait_rows_changed(
+    page: Page, cfg: CrawlConfig, before: Optional[str], timeout_ms: int
+) -> None:
+    """목록 그리드가 다시 그려질 때까지 대기 (고정 sleep 대신). 시간 초과는 무시: 결과가 같은 경우도 있음."""
+    try:
+        await page.wait_for_function(
+            _ROWS_CHANGED_JS, arg=[cfg.row_selector_candidates, before], timeout=timeout_ms
+        )
+    except PlaywrightTimeoutError:
+        pass
+
+
+def _is_xhr(response: Response) -> bool:
+    return response.request.resource_type in ("xhr", "fetch")
+
+
+@asynccontextmanager
+async def _expect_xhr(page: Page, timeout_ms: int) -> AsyncIterator[None]:
+    """
+    블록 안의 클릭으로 나간 XHR/fetch 응답이 올 때까지 대기 (고정 sleep 대신).
+    응답이 없으면(시간 초과) 그냥 진행하고, 블록 자체의 예외는 그대로 올린다.
+    """
+    body_done = False
+    try:
+        async with page.expect_response(_is_xhr, timeout=timeout_ms):
+            yield
+            body_done = True
+    except PlaywrightTimeoutError:
+        if not body_done:
+            raise
 
 
 async def _click_by_text(page: Page, text: str, timeout_ms: int = 5000) -> None:
@@ -96,7 +252,7 @@ async def _click_by_text(page: Page, text: str, timeout_ms: int = 5000) -> None:
         return
     except Exception as e:
         errors.append(e)
-    raise RuntimeError(f"failed clicking by text={text}") from errors[-1]
+    raise ElementNotFoundError(f"failed clicking by text={text}") from errors[-1]
 
 
 async def _navigate_mega_menu(page: Page, cfg: CrawlConfig) -> None:
@@ -113,7 +269,6 @@ async def _navigate_mega_menu(page: Page, cfg: CrawlConfig) -> None:
     hover_loc = page.locator(d1_sel).filter(has_text=hover_text).first
     await hover_loc.wait_for(state="visible", timeout=5000)
     await hover_loc.hover()
-    await page.wait_for_timeout(100)
 
     # depth3(입찰공고목록) 클릭
     click_loc = page.locator(d3_sel).filter(has_text=click_text).first
@@ -124,7 +279,6 @@ async def _navigate_mega_menu(page: Page, cfg: CrawlConfig) -> None:
 @default_retry()
 async def navigate_to_bid_list(page: Page, cfg: CrawlConfig) -> None:
     await page.goto(cfg.base_url, wait_until="domcontentloaded", timeout=20000)
-    await page.wait_for_timeout(100)
 
     if cfg.mega_menu:
         await _navigate_mega_menu(page, cfg)
@@ -133,27 +287,52 @@ async def navigate_to_bid_list(page: Page, cfg: CrawlConfig) -> None:
 
     # 입찰공고목록 페이지에서 필터창 "검색" 버튼 클릭 → 조회 결과 로드 (통합검색 X)
     if cfg.search_button_text or cfg.search_button_selector:
-        await page.wait_for_timeout(300)
-        # 필터 영역(btn_shbox) 검색 버튼 우선 사용
-        if cfg.search_button_selector:
-            try:
-                await page.locator(cfg.search_button_selector).first.click(timeout=8000)
-            except Exception:
-                if cfg.search_button_text:
+        # 검색 클릭 전 상태를 기억해 두고, 클릭으로 나간 조회 요청의 응답 + 그리드 갱신을 기다림
+        before = await _first_row_text(page, cfg)
+        # 필터 영역(btn_shbox) 검색 버튼 우선 사용 (click이 표시/활성화까지 자동 대기)
+        async with _expect_xhr(page, timeout_ms=8000):
+            if cfg.search_button_selector:
+                try:
+                    await page.locator(cfg.search_button_selector).first.click(timeout=8000)
+                except Exception:
+                    if cfg.search_button_text:
+                        await _click_by_text(page, cfg.search_button_text, timeout_ms=8000)
+            elif cfg.search_button_text:
+                try:
+                    await page.locator(f'div.btn_shbox input[value="{cfg.search_button_text}"]').first.click(timeout=8000)
+                except Exception:
                     await _click_by_text(page, cfg.search_button_text, timeout_ms=8000)
-        elif cfg.search_button_text:
-            try:
-                await page.locator(f'div.btn_shbox input[value="{cfg.search_button_text}"]').first.click(timeout=8000)
-            except Exception:
-                await _click_by_text(page, cfg.search_button_text, timeout_ms=8000)
-        # 그리드 비동기 로드 대기 (검색 요청 → 응답 → 렌더)
-        await page.wait_for_timeout(1500)
+        # 그리드 렌더 대기 (검색 요청 → 응답 → 렌더)
+        await _wait_rows_changed(page, cfg, before, timeout_ms=1500)
 
     # 목록 화면 준비 대기 (데이터 행 tr.grid_body_row)
     sel = await _wait_any_selector(page, cfg.bid_list_ready_selectors, timeout_ms=20000)
     log.info("목록 준비 완료 (selector=%s)", sel)
 
 
+async def open_bid_list(page: Page, cfg: CrawlConfig, state: StateStore) -> None:
+    """
+    목록 화면 진입. 지난 실행에서 도착한 목록 URL(bid_list.url 체크포인트)이 있으면 바로 열고,
+    없거나 목록이 뜨지 않으면 메가메뉴 + 검색 경로로 진입한 뒤 도착 URL을 기록한다.
+    """
+    list_url = state.get_checkpoint("bid_list.url")
+    if list_url:
+        try:
+            await page.goto(list_url, wait_until="domcontentloaded", timeout=20000)
+            sel = await _wait_any_selector(page, cfg.bid_list_ready_selectors, timeout_ms=8000)
+            log.info("목록 준비 완료 (저장된 URL, selector=%s)", sel)
+            return
+        except Exception:
+            log.info("저장된 목록 URL로 진입 실패, 메뉴 경로로 진입: %s", list_url)
+    await navigate_to_bid_list(page, cfg)
+    # 시작 URL과 같으면(SPA 내부 이동) 바로가기가 되지 않으므로 기록하지 않음
+    landed = page.url
+    if landed.rstrip("/") == cfg.base_url.rstrip("/"):
+        landed = ""
+    if landed != (list_url or ""):
+        state.set_checkpoint("bid_list.url", landed)
+
+
 @default_retry()
 async def _goto_or_recover_list(page: Page, cfg: CrawlConfig) -> None:
     try:
@@ -162,14 +341,188 @@ async def _goto_or_recover_list(page: Page, cfg: CrawlConfig) -> None:
         await navigate_to_bid_list(page, cfg)
 
 
+async def _click_and_wait_list(page: Page, cfg: CrawlConfig, target: Locator) -> None:
+    """페이지 이동 클릭 후 이전 첫 행이 바뀔 때까지 기다려 이전 페이지를 다시 읽지 않게 함."""
+    before = await _first_row_text(page, cfg)
+    await target.click(timeout=8000)
+    await _wait_rows_changed(page, cfg, before, timeout_ms=8000)
+    await _goto_or_recover_list(page, cfg)
+
+
+async def _count_or_zero(loc: Locator) -> int:
+    try:
+        return await loc.count()
+    except Exception:
+        return 0
+
+
+async def go_to_next_page(page: Page, cfg: CrawlConfig, current_page: int) -> bool:
+    """
+    다음 목록 페이지로 이동. 이동했으면 True.
+    - 후보 우선순위: 0) 페이지 번호 링크 1) CSS 선택자 2) role/text.
+    - 후보별 count() 조회는 한꺼번에 보내고(왕복 시간의 합 -> 최댓값), 클릭은 존재하는 후보만 우선순위대로 시도.
+    """
+    next_page_num = current_page + 1
+    # 0) 페이지 번호 링크 직접 클릭 (next/nextPage 버튼 혼동 방지)
+    candidates: List[Tuple[str, Locator]] = [
+        (f"page link {next_page_num}", page.locator(f"a[id*='pagelist_page_'][index='{next_page_num}']")),
+    ]
+    # 1) CSS 선택자 우선 (누리장터 w2pageList 등 커스텀 페이지네이션)
+    candidates += [(f"selector {sel}", page.locator(sel)) for sel in cfg.next_button_selector_candidates]
+    # 2) role/text 기반 폴백
+    for name in cfg.next_button_name_candidates:
+        candidates += [
+            (name, page.get_by_role("button", name=name)),
+            (name, page.get_by_role("link", name=name)),
+            (name, page.get_by_text(name, exact=True)),
+        ]
+
+    counts = await asyncio.gather(*(_count_or_zero(loc) for _, loc in candidates))
+    for (label, loc), n in zip(candidates, counts):
+        if n == 0:
+            continue
+        try:
+            await loc.first.scroll_into_view_if_needed(timeout=5000)
+            await _click_and_wait_list(page, cfg, loc.first)
+        except Exception:
+            continue
+        log.info("다음 페이지로 이동 (%s)", label)
+        return True
+    return False
+
+
+# 상세 th/td, dt/dd 추출 함수 (root 하위만 탐색). 상세 페이지와 목록 인라인 패널에서 공용.
+_DETAIL_RAW_JS = """
+(root) => {
+    const cellText = (el) => (el.textContent || '').trim();
+    const ordered = [];
+    const tables = [];
+
+    // 행 목록은 한 번만 조회하고, 행/dl 안의 셀은 getElementsByTagName으로 모은다.
+    // (querySelectorAll('th'/'td'/'dt'/'dd')와 같은 '모든 하위 요소' 의미: 중첩 표의 셀, 깊게 감싼 dt/dd 포함)
+    const trs = root.querySelectorAll('table tr');
+    for (let i = 0; i < trs.length; i++) {
+        const ths = trs[i].getElementsByTagName('th');
+        const tds = trs[i].getElementsByTagName('td');
+        if (ths.length >= 1 && tds.length >= 1) {
+            const n = Math.min(ths.length, tds.length);
+            for (let j = 0; j < n; j++) ordered.push([cellText(ths[j]), cellText(tds[j])]);
+        } else if (ths.length >= 2 && tds.length === 0) {
+            tables.push({ headers: Array.from(ths, cellText), rows: [] });
+        } else if (ths.length === 0 && tds.length >= 1 && tables.length) {
+            tables[tables.length - 1].rows.push(Array.from(tds, cellText));
+        } else if (ths.length === 1 && tds.length === 0) {
+            ordered.push([cellText(ths[0]), '']);
+        }
+    }
+
+    // dl: 하위 dt/dd를 순서대로 짝지음. 표 항목 뒤에 붙인다.
+    const dls = root.getElementsByTagName('dl');
+    for (let i = 0; i < dls.length; i++) {
+        const dts = dls[i].getElementsByTagName('dt');
+        const dds = dls[i].getElementsByTagName('dd');
+        const n = Math.min(dts.length, dds.length);
+        for (let j = 0; j < n; j++) ordered.push([cellText(dts[j]), cellText(dds[j])]);
+    }
+    return { ordered, tables };
+}
+"""
+
+
+# 상세 th/td 쌍을 대분류→소분류로 나누는 함수. spec은 DetailExtractor.js_spec.
+# 결과는 키 순서를 지키도록 [섹션, [[키, 값], ...] | null(표 섹션)] 배열로 돌려준다.
+_DETAIL_SECTION_JS = """
+(raw, spec) => {
+    if (spec.flat) return { flat: raw.ordered.filter(([k]) => k) };
+    const norm = (k) => (k || '').replace(/\\s+/g, '');
+    const EMPTY = new Set();
+    const sectionSet = new Set(spec.sections);
+    const tableSections = new Set(spec.tableSections);
+    const sectionIdx = new Map(spec.sections.map((s, i) => [s, i]));
+    const keyToSections = new Map(Object.entries(spec.keyToSections));
+    const normFields = new Map(Object.entries(spec.normFields).map(([s, fs]) => [s, new Set(fs)]));
+    const fields = new Map(Object.entries(spec.fields).map(([s, fs]) => [s, new Set(fs)]));
+    const idx = (s) => (sectionIdx.has(s) ? sectionIdx.get(s) : -1);
+
+    const out = new Map();
+    let current = spec.sections.length ? spec.sections[0] : null;
+    if (current !== null && !tableSections.has(current)) out.set(current, new Map());
+
+    // 필드로 섹션 전환: 현재 섹션 뒤쪽 후보 우선, 없으면 마지막 후보
+    const sectionFor = (nk) => {
+        const cands = keyToSections.get(nk);
+        if (!cands || !cands.length) return null;
+        const curI = idx(current);
+        for (const sec of cands) {
+            if ((sectionIdx.has(sec) ? sectionIdx.get(sec) : 999) > curI) return sec;
+        }
+        return cands[cands.length - 1];
+    };
+
+    for (const [k, v] of raw.ordered) {
+        const nk = norm(k);
+        if (!nk) continue;
+        if (sectionSet.has(nk)) {
+            current = nk;
+            if (!out.has(current)) out.set(current, tableSections.has(current) ? [] : new Map());
+            const sec = out.get(current);
+            if (v && sec instanceof Map) sec.set(k, v);
+            continue;
+        }
+        const curFields = normFields.get(current) || EMPTY;
+        const target = sectionFor(nk);
+        const curOut = out.get(current);
+        const alreadyInCurrent = curFields.has(nk) && curOut instanceof Map
+            && Array.from(curOut.keys()).some((key) => norm(key) === nk);
+        if (target && target !== current && !tableSections.has(target)
+            && (!curFields.has(nk) || alreadyInCurrent)) {
+            current = target;
+            if (!out.has(current)) out.set(current, new Map());
+        }
+        if (!current || !out.has(current)) continue;
+        const sec = out.get(current);
+        if (!(sec instanceof Map)) continue;
+        const secFields = fields.get(current) || EMPTY;
+        if (secFields.size && !(normFields.get(current) || EMPTY).has(nk) && !secFields.has(nk)) {
+            if (current !== spec.catchAllSection) continue;
+        }
+        sec.set(k, v);
+    }
+    return {
+        sections: Array.from(out, ([s, val]) => [s, val instanceof Map ? Array.from(val) : null]),
+        tables: raw.tables,
+    };
+}
+"""
+
+
 def _guess_notice_id(detail_url: Optional[str], row_text: str) -> str:
-    if detail_url:
-        return sha256_text(detail_url)[:24]
-    # 공고번호 패턴을 모를 때의 안전망
-    return sha256_text(row_text)[:24]
+    # 공고번호 패턴을 모를 때는 행 텍스트가 안전망
+    return _short_hash_id(detail_url or row_text)
+
+
+# 같은 공고는 페이지 재방문/interval 회차마다 다시 나오므로 ID 계산 결과를 재사용.
+# (ID는 기존 state DB와 맞아야 하므로 해시 방식은 sha256 그대로)
+@lru_cache(maxsize=4096)
+def _short_hash_id(key: str) -> str:
+    return sha256_text(key)[:24]
 
 
 async def extract_list_items(page: Page, cfg: CrawlConfig, limit: int) -> List[ListItem]:
+    items, _ = await extract_list_page(page, cfg, limit)
+    return items
+
+
+async def extract_list_page(
+    page: Page, cfg: CrawlConfig, limit: int, extractor: Optional[DetailExtractor] = None
+) -> Tuple[List[ListItem], Dict[str, Dict[str, Any]]]:
+    """
+    목록 행과, 행에 딸린 인라인 상세 패널(list.inline_detail_selector)을 evaluate 1회로 추출.
+    반환: (목록 항목, notice_id -> 섹션 분류된 상세 결과 + html). 결과는 extractor.finish()로 마무리.
+    """
+    spec = None
+    if cfg.inline_detail_selector:
+        spec = (extractor or DetailExtractor(cfg)).js_spec
     row_sel = await _wait_any_selector(page, cfg.row_selector_candidates, timeout_ms=15000)
     rows = page.locator(row_sel)
     count = await rows.count()
@@ -177,44 +530,68 @@ async def extract_list_items(page: Page, cfg: CrawlConfig, limit: int) -> List[L
     log.info("목록 행 %d개 발견 (selector=%s, 추출 limit=%d)", count, row_sel, n)
     if count > 0:
         await rows.first.scroll_into_view_if_needed()
-        await page.wait_for_timeout(200)
+        # 스크롤로 생긴 가상스크롤 행이 그려지도록 한 프레임만 대기
+        await page.evaluate("() => new Promise((r) => requestAnimationFrame(() => r()))")
 
     # page.evaluate로 한 번에 추출 (가상스크롤/요소 detach 회피)
-    raw_data: List[Dict[str, Any]] = await page.evaluate(
+    payload: Dict[str, Any] = await page.evaluate(
         """
-        ([selector, limit]) => {
+        ([selector, limit, linkSelectors, inlineSelector, spec]) => {
+            const extractDetail = """
+        + _DETAIL_RAW_JS
+        + """;
+            const sectionize = """
+        + _DETAIL_SECTION_JS
+        + """;
             const rows = document.querySelectorAll(selector);
             const result = [];
+            const inlineDetails = [];
             const n = Math.min(rows.length, limit);
             for (let i = 0; i < n; i++) {
                 const row = rows[i];
                 const text = (row.innerText || '').trim();
                 let href = null;
-                const a = row.querySelector('a');
-                if (a) href = a.getAttribute('href');
+                for (const ls of linkSelectors) {
+                    const a = row.querySelector(ls);
+                    if (a) { href = a.getAttribute('href'); break; }
+                }
                 result.push({ text, href, i });
+                let detail = null;
+                if (inlineSelector) {
+                    // 행 내부 패널 또는 바로 다음 형제(펼침 행)
+                    let panel = row.querySelector(inlineSelector);
+                    const next = row.nextElementSibling;
+                    if (!panel && next && next.matches(inlineSelector)) panel = next;
+                    if (panel) {
+                        detail = sectionize(extractDetail(panel), spec);
+                        detail.html = panel.innerHTML;
+                    }
+                }
+                inlineDetails.push(detail);
             }
-            return result;
+            return { rows: result, inlineDetails };
         }
         """,
-        [row_sel, n],
+        [row_sel, n, cfg.link_selector_candidates or ("a",), cfg.inline_detail_selector, spec],
     )
+    raw_data: List[Dict[str, Any]] = payload.get("rows") or []
+    inline_raw: List[Optional[Dict[str, Any]]] = payload.get("inlineDetails") or []
+    inline_details: Dict[str, Dict[str, Any]] = {}
     items: List[ListItem] = []
+    # 컬럼 배치는 설정에서 정해지므로 행마다 다시 자르지 않음: 앞 10개는 순서대로, 마지막 3개는 뒤에서부터
     cols = cfg.list_columns
+    head_cols = cols[:10]
+    tail_cols = cols[10:13] if len(cols) >= 13 else ()
     for d in raw_data:
         text = d.get("text") or ""
         detail_url = d.get("href")
         notice_id = _guess_notice_id(detail_url, text)
-        parts = [p.strip() for p in text.replace("\n", "\t").split("\t") if p.strip()]
+        parts = [q for q in (p.strip() for p in _SPLIT_RE.split(text)) if q]
         parsed: Dict[str, str] = {}
-        if cols and parts:
-            for i, name in enumerate(cols[:10]):
-                if i < len(parts):
-                    parsed[name] = parts[i]
-            if len(cols) >= 13 and len(parts) >= 3:
-                parsed[cols[10]] = parts[-3]
-                parsed[cols[11]] = parts[-2]
-                parsed[cols[12]] = parts[-1]
+        if parts:
+            parsed.update(zip(head_cols, parts))
+            if tail_cols and len(parts) >= 3:
+                parsed.update(zip(tail_cols, parts[-3:]))
         title = parsed.get("입찰공고명") or (parts[2] if len(parts) > 2 else None) or text.split("\n")[0].strip()
         items.append(
             ListItem(
@@ -228,7 +605,10 @@ async def extract_list_items(page: Page, cfg: CrawlConfig, limit: int) -> List[L
                 raw={"row_selector": row_sel, "row_index": d.get("i", 0), "parsed": parsed},
             )
         )
-    return items
+        idx = d.get("i", 0)
+        if idx < len(inline_raw) and inline_raw[idx]:
+            inline_details[notice_id] = inline_raw[idx]
+    return items, inline_details
 
 
 def _is_navigable_url(href: Optional[str]) -> bool:
@@ -240,35 +620,65 @@ def _is_navigable_url(href: Optional[str]) -> bool:
     return True
 
 
-async def _open_detail(page: Page, item: ListItem) -> None:
+_CLICK_ROW_LINK_JS = """
+([selector, idx]) => {
+    const rows = document.querySelectorAll(selector);
+    const row = rows[idx];
+    if (row) {
+        const a = row.querySelector('a');
+        if (a) { a.click(); return true; }
+    }
+    return false;
+}
+"""
+
+
+async def _click_row_link(page: Page, row_sel: str, row_idx: int) -> Page:
+    """
+    목록 행 링크를 evaluate로 클릭하고, 상세가 표시된 탭을 돌려준다.
+    - 새 창(popup)으로 열리면 그 탭을, 같은 화면(SPA)에서 열리면 page를 반환.
+    - popup 또는 클릭으로 나간 XHR 응답 중 먼저 오는 것을 기다림 (최대 5초, 시간 초과는 무시).
+    """
+    popup = asyncio.ensure_future(page.wait_for_event("popup", timeout=5000))
+    xhr = asyncio.ensure_future(page.wait_for_event("response", predicate=_is_xhr, timeout=5000))
+    waiters = (popup, xhr)
+    # 클릭 전에 두 대기가 리스너를 등록하도록 한 번 양보
+    await asyncio.sleep(0)
+    try:
+        clicked = await page.evaluate(_CLICK_ROW_LINK_JS, [row_sel, row_idx])
+        if not clicked:
+            raise RuntimeError("상세 페이지 진입 실패: 링크를 찾을 수 없음")
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for w in waiters:
+            if not w.done():
+                w.cancel()
+    # 끝난 대기의 예외(시간 초과 등)는 회수만 하고 무시
+    for w in waiters:
+        if w.done() and not w.cancelled():
+            w.exception()
+    if popup.done() and not popup.cancelled() and popup.exception() is None:
+        detail = popup.result()
+        await detail.wait_for_load_state("domcontentloaded")
+        return detail
+    await page.wait_for_load_state("domcontentloaded")
+    return page
+
+
+async def _open_detail(page: Page, item: ListItem) -> Page:
+    """상세 화면으로 진입하고 상세가 표시된 탭을 반환 (page 자신 또는 새로 열린 popup)."""
     # 1) 실제 URL인 경우 goto 시도
     if _is_navigable_url(item.detail_url):
         try:
             await page.goto(item.detail_url, wait_until="domcontentloaded", timeout=20000)
-            return
+            return page
         except Exception:
             pass
     # 2) row 내 링크를 evaluate로 클릭 (가상스크롤/긴텍스트 회피)
     row_sel = item.raw.get("row_selector")
     row_idx = item.raw.get("row_index", 0)
     if row_sel is not None:
-        clicked = await page.evaluate(
-            """
-            ([selector, idx]) => {
-                const rows = document.querySelectorAll(selector);
-                const row = rows[idx];
-                if (row) {
-                    const a = row.querySelector('a');
-                    if (a) { a.click(); return true; }
-                }
-                return false;
-            }
-            """,
-            [row_sel, row_idx],
-        )
-        if clicked:
-            await page.wait_for_timeout(300)
-            return
+        return await _click_row_link(page, row_sel, row_idx)
     raise RuntimeError("상세 페이지 진입 실패: 링크를 찾을 수 없음")
 
 
@@ -276,177 +686,171 @@ def _normalize_key(k: str) -> str:
     """줄바꿈/공백 정규화 (입찰보증서\\n접수마감일시 -> 입찰보증서접수마감일시)"""
     if not k:
         return ""
-    return "".join(k.split())
-
-
-async def _extract_detail_raw(page: Page) -> Dict[str, Any]:
-    """th/td, dt/dd를 순서 유지하며 추출. textContent 폴백으로 동적 렌더 값 수집."""
-    r: Dict[str, Any] = await page.evaluate(
-        """
-        () => {
-            const trim = (s) => (s ?? '').toString().trim();
-            const cellText = (el) => {
-                if (!el) return '';
-                return trim((el.textContent || el.innerText || '').toString());
-            };
-            const ordered = [];
-            const tables = [];
-
-            document.querySelectorAll('table tr').forEach(tr => {
-                const ths = tr.querySelectorAll('th');
-                const tds = tr.querySelectorAll('td');
-                if (ths.length >= 1 && tds.length >= 1) {
-                    for (let j = 0; j < Math.min(ths.length, tds.length); j++) {
-                        ordered.push([cellText(ths[j]), cellText(tds[j])]);
-                    }
-                } else if (ths.length >= 2 && tds.length === 0) {
-                    tables.push({ headers: Array.from(ths).map(h => cellText(h)), rows: [] });
-                } else if (ths.length === 0 && tds.length >= 1 && tables.length) {
-                    const last = tables[tables.length - 1];
-                    if (last.headers) last.rows.push(Array.from(tds).map(c => cellText(c)));
-                } else if (ths.length === 1 && tds.length === 0) {
-                    ordered.push([cellText(ths[0]), '']);
-                }
-            });
-            document.querySelectorAll('dl').forEach(dl => {
-                const dts = dl.querySelectorAll('dt');
-                const dds = dl.querySelectorAll('dd');
-                for (let j = 0; j < Math.min(dts.length, dds.length); j++) {
-                    ordered.push([cellText(dts[j]), cellText(dds[j])]);
-                }
-            });
-            return { ordered, tables };
-        }
-        """
-    )
-    return r or {"ordered": [], "tables": []}
+    return _WS_RE.sub("", k)
 
 
 async def extract_detail_kv(page: Page, cfg: CrawlConfig) -> Dict[str, Any]:
     """입찰공고진행상세 등에서 대분류→소분류 구조로 추출 (공백값 포함)"""
-    return await _extract_detail_kv_sectioned(page, cfg)
-
-
-async def _extract_detail_kv_sectioned(page: Page, cfg: CrawlConfig) -> Dict[str, Any]:
-    """필드→섹션 매핑으로 대분류→소분류 구조 생성."""
-    sections = cfg.detail_sections or []
-    field_sections = cfg.detail_field_sections or {}
-    table_columns = cfg.detail_table_columns or {}
-    table_section_names = set(cfg.detail_table_sections or [])
-
-    if not sections and not field_sections:
-        raw = await _extract_detail_raw(page)
-        return {k: v for k, v in raw.get("ordered", []) if k}
-
-    raw = await _extract_detail_raw(page)
-    ordered: List[List[str]] = raw.get("ordered", [])
-    tables: List[Dict[str, Any]] = raw.get("tables", [])
-
-    section_set = set(sections)
-    out: Dict[str, Any] = {}
-    current = sections[0] if sections else None
-    if current and current not in table_section_names:
-        out[current] = {}
-
-    # 필드->섹션 매핑 (섹션 제목 없이 필드로 전환). 중복필드(지역제한 등)는 섹션 순서 유지.
-    key_to_section_order: Dict[str, List[str]] = {}
-    for sec in sections:
-        if sec in table_section_names:
-            continue
-        for f in (field_sections.get(sec) or []):
-            nf = _normalize_key(f)
-            if nf:
-                key_to_section_order.setdefault(nf, []).append(sec)
-    section_idx = {s: i for i, s in enumerate(sections)}
-
-    def _section_for_key(nk: str) -> Optional[str]:
-        cands = key_to_section_order.get(nk)
-        if not cands:
-            return None
-        cur_i = section_idx.get(current, -1)
-        for sec in cands:
-            if section_idx.get(sec, 999) > cur_i:
-                return sec
-        return cands[-1]
-
-    for k, v in ordered:
-        nk = _normalize_key(k)
-        if not nk:
-            continue
-        if nk in section_set:
-            current = nk
-            if current not in out:
-                out[current] = [] if current in table_section_names else {}
-            if v and current not in table_section_names and isinstance(out.get(current), dict):
-                out[current][k] = v
-            continue
-        cur_fields = {_normalize_key(f) for f in (field_sections.get(current) or [])}
-        target = _section_for_key(nk)
-        already_in_current = nk in cur_fields and isinstance(out.get(current), dict) and any(
-            _normalize_key(key) == nk for key in out.get(current, {})
-        )
-        if target and target != current and target not in table_section_names and (
-            nk not in cur_fields or already_in_current
-        ):
-            current = target
-            if current not in out:
-                out[current] = {}
-        if not current or current not in out:
-            continue
-        if isinstance(out[current], list):
-            continue
-        fields = field_sections.get(current, [])
-        norm_fields = {_normalize_key(f): f for f in fields}
-        if fields and nk not in norm_fields and nk not in fields:
-            if current != "공고일반":
-                continue
-        out[current][k] = v
-
-    col_aliases: Dict[str, str] = {"번호": "재입찰번호", "공고": "공고명"}
-    for tbl in tables:
-        headers = [_normalize_key(h) for h in tbl.get("headers", [])]
-        header_set = set(headers)
-        header_canonical = {h: _normalize_key(col_aliases.get(h, h)) for h in headers}
-        rows = tbl.get("rows", [])
-        for sec, cols in table_columns.items():
-            if sec in out and isinstance(out.get(sec), list) and out[sec]:
-                continue
-            want = [_normalize_key(c) for c in cols]
-            want_set = set(want)
-            orig_col = {_normalize_key(c): c for c in cols}
-            if not want_set:
+    return await DetailExtractor(cfg).extract(page)
+
+
+# 상세 키/표 헤더는 페이지가 달라도 같은 문자열이 반복된다
+@lru_cache(maxsize=4096)
+def _normalize_key_cached(k: str) -> str:
+    # intern: 같은 키 문자열을 하나의 객체로 공유해 dict/set 비교가 동일성 검사로 끝나게 함
+    return sys.intern(_normalize_key(k))
+
+_TABLE_COL_ALIASES: Dict[str, str] = {"번호": "재입찰번호", "공고": "공고명"}
+# 필드 목록에 없는 키도 받아 두는 섹션
+_CATCH_ALL_SECTION = "공고일반"
+
+
+class DetailExtractor:
+    """
+    필드→섹션 매핑으로 대분류→소분류 구조 생성.
+    - th/td 쌍의 섹션 분류는 브라우저(_DETAIL_SECTION_JS)에서 끝내고, 분류 결과와 표만 넘겨받는다.
+    - 설정에서 유도되는 매핑(섹션 순서, 필드 정규화, 표 컬럼)은 생성 시 한 번만 계산해 재사용
+      (crawl_once에서 회차당 1개 생성).
+    """
+
+    def __init__(self, cfg: CrawlConfig):
+        nk = _normalize_key_cached
+        sections = cfg.detail_sections
+        field_sections = cfg.detail_field_sections
+        # 표 섹션: 출력 순서는 설정 순서(tuple), 포함 여부는 frozenset
+        self.table_sections: Tuple[str, ...] = tuple(sys.intern(sec) for sec in cfg.detail_table_sections)
+        self.table_section_names: FrozenSet[str] = frozenset(self.table_sections)
+
+        # 필드->섹션 매핑 (섹션 제목 없이 필드로 전환). 중복필드(지역제한 등)는 섹션 순서 유지.
+        key_to_sections: Dict[str, List[str]] = {}
+        for sec in sections:
+            if sec in self.table_section_names:
                 continue
+            for f in field_sections.get(sec, ()):
+                nf = nk(f)
+                if nf:
+                    key_to_sections.setdefault(nf, []).append(sec)
+        # page.evaluate 인자로 넘기는 분류 규칙 (JSON 직렬화 가능한 기본 타입만)
+        self.js_spec: Dict[str, Any] = {
+            "flat": not sections and not field_sections,
+            "sections": list(sections),
+            "tableSections": list(self.table_sections),
+            "keyToSections": key_to_sections,
+            "fields": {sec: list(fs) for sec, fs in field_sections.items()},
+            "normFields": {sec: [nk(f) for f in fs] for sec, fs in field_sections.items()},
+            "catchAllSection": _CATCH_ALL_SECTION,
+        }
+        # 표 섹션별 (섹션, 원하는 컬럼 집합, 정규화 컬럼 -> 원래 컬럼명)
+        self.table_specs: Tuple[Tuple[str, FrozenSet[str], Dict[str, str]], ...] = tuple(
+            (sec, frozenset(nk(c) for c in cols), {nk(c): c for c in cols})
+            for sec, cols in cfg.detail_table_columns.items()
+        )
+
+    async def extract(self, page: Page) -> Dict[str, Any]:
+        res = await page.evaluate(
+            f"(spec) => ({_DETAIL_SECTION_JS})(({_DETAIL_RAW_JS})(document), spec)", self.js_spec
+        )
+        return self.finish(res or {})
+
+    def finish(self, res: Dict[str, Any]) -> Dict[str, Any]:
+        """_DETAIL_SECTION_JS 결과에 표 섹션을 채워 최종 dict로 변환 (브라우저 호출 없음)."""
+        if "flat" in res:
+            return dict(res["flat"])
+        out: Dict[str, Any] = {
+            sec: [] if pairs is None else dict(pairs) for sec, pairs in res.get("sections") or []
+        }
+        self._fill_tables(out, res.get("tables") or [])
+        for sec in self.table_sections:
+            if sec not in out:
+                out[sec] = []
+        return out
+
+    def _fill_tables(self, out: Dict[str, Any], tables: List[Dict[str, Any]]) -> None:
+        normalize = _normalize_key_cached
+        for tbl in tables:
+            headers = [normalize(h) for h in tbl.get("headers", [])]
+            header_canonical = {h: normalize(_TABLE_COL_ALIASES.get(h, h)) for h in headers}
             expanded = set(header_canonical.values())
-            overlap = want_set & expanded
-            if not (want_set <= expanded or len(overlap) >= max(2, len(want_set) - 1)):
-                continue
-            use_cols = overlap if overlap else want_set
-            recs = []
-            for row in rows:
-                rec = {}
-                for i, h in enumerate(headers):
-                    canon = header_canonical.get(h, h)
-                    if i < len(row) and canon in use_cols:
-                        key = orig_col.get(canon, col_aliases.get(h, h))
-                        rec[key] = (row[i] or "").strip()
-                if any(rec.values()):
-                    recs.append(rec)
-            if recs:
-                out[sec] = recs
-            break
-
-    for sec in table_section_names:
-        if sec not in out:
-            out[sec] = []
-
-    return out
-
-
-async def save_evidence(errors_dir: Path, notice_id: str, page: Page, err: Exception) -> None:
+            rows = tbl.get("rows", [])
+            for sec, want_set, orig_col in self.table_specs:
+                if sec in out and isinstance(out.get(sec), list) and out[sec]:
+                    continue
+                if not want_set:
+                    continue
+                overlap = want_set & expanded
+                if not (want_set <= expanded or len(overlap) >= max(2, len(want_set) - 1)):
+                    continue
+                use_cols = overlap if overlap else want_set
+                recs = []
+                for row in rows:
+                    rec = {}
+                    for i, h in enumerate(headers):
+                        canon = header_canonical.get(h, h)
+                        if i < len(row) and canon in use_cols:
+                            key = orig_col.get(canon, _TABLE_COL_ALIASES.get(h, h))
+                            rec[key] = (row[i] or "").strip()
+                    if any(rec.values()):
+                        recs.append(rec)
+                if recs:
+                    out[sec] = recs
+                break
+
+
+# 변경 감지용 HTML 해시를 브라우저 안에서 계산 (HTML 전체를 CDP로 옮기지 않음).
+# crypto.subtle은 보안 컨텍스트(https)에서만 있으므로 없으면 null
+# page.content()와 같은 문자열(doctype + documentElement.outerHTML)을 만들어 해시한다.
+# SubtleCrypto가 없으면 그 문자열을 그대로 돌려주고 파이썬에서 계산 -> 두 경로의 해시가 항상 같다.
+_HTML_SHA256_JS = """
+async () => {
+  let html = '';
+  if (document.doctype) html = new XMLSerializer().serializeToString(document.doctype);
+  if (document.documentElement) html += document.documentElement.outerHTML;
+  if (!(window.crypto && crypto.subtle)) return { html };
+  const buf = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(html));
+  return { digest: Array.from(new Uint8Array(buf), (b) => b.toString(16).padStart(2, '0')).join('') };
+}
+"""
+
+
+async def page_content_hash(page: Page) -> str:
+    """상세 HTML(page.content()와 같은 직렬화)의 SHA-256 hex. SubtleCrypto를 못 쓰면 파이썬에서 계산."""
+    res = await page.evaluate(_HTML_SHA256_JS)
+    if res.get("digest"):
+        return res["digest"]
+    return sha256_text(res.get("html") or "")
+
+
+async def fetch_detail_html(client: "httpx.AsyncClient", url: str) -> Optional[str]:
+    """상세 URL을 HTTP로 받아 HTML 문자열을 반환. HTML 200 응답이 아니면 None (브라우저로 대체)."""
+    resp = await client.get(url)
+    if resp.status_code != 200 or "html" not in resp.headers.get("content-type", ""):
+        return None
+    return resp.text
+
+
+async def _open_http_client(context: BrowserContext, cfg: CrawlConfig) -> "httpx.AsyncClient":
+    """상세 HTTP 수집용 클라이언트 (HTTP/2 + keep-alive 풀, 브라우저 context의 쿠키를 이어받음)."""
+    import httpx
+
+    cookies = httpx.Cookies()
+    for c in await context.cookies():
+        cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=15.0,
+        follow_redirects=True,
+        cookies=cookies,
+        headers={"User-Agent": "Mozilla/5.0"},
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=max(cfg.detail_concurrency, 1)),
+    )
+
+
+async def save_evidence(errors_dir: StrPath, notice_id: str, page: Page) -> None:
+    """실패 시점의 화면(HTML/스크린샷)만 파일로 남긴다. 오류 내용은 StateStore의 errors 테이블에 기록."""
+    errors_dir = Path(errors_dir)
     errors_dir.mkdir(parents=True, exist_ok=True)
     ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     base = errors_dir / f"{safe_filename(notice_id)}_{ts}"
-    meta_path = base.with_suffix(".json")
     html_path = base.with_suffix(".html")
     png_path = base.with_suffix(".png")
 
@@ -459,190 +863,387 @@ async def save_evidence(errors_dir: Path, notice_id: str, page: Page, err: Excep
         await page.screenshot(path=str(png_path), full_page=True)
     except Exception:
         pass
-    meta = {
-        "notice_id": notice_id,
-        "error": repr(err),
-        "url": page.url,
-        "collected_at_utc": utc_now_iso(),
-    }
-    meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+# 컨테이너/서버 환경에서 /dev/shm 부족 크래시 방지, 화면 합성용 GPU 프로세스 생략
+_CHROMIUM_ARGS = ["--disable-dev-shm-usage", "--disable-gpu"]
+
+
+async def launch_browser(pw: Playwright, headless: bool, debug_slowmo_ms: int = 0) -> Browser:
+    return await pw.chromium.launch(headless=headless, slow_mo=debug_slowmo_ms, args=_CHROMIUM_ARGS)
+
+
+async def block_heavy_resources(context: BrowserContext, resource_types: Sequence[str]) -> None:
+    """수집에 필요 없는 리소스(이미지/폰트/미디어 등) 요청을 context 단위로 차단."""
+    if not resource_types:
+        return
+    blocked = frozenset(resource_types)
+
+    async def _route(route: Route) -> None:
+        if route.request.resource_type in blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _route)
+
+
+class SharedBrowser:
+    """
+    여러 번의 crawl_once 실행에 재사용하는 Playwright 브라우저 (interval 모드 / UI용).
+    - 매 실행마다 Chromium을 새로 띄우는 비용을 없애고, 끊긴 경우에만 다시 띄운다.
+    """
+
+    def __init__(self, headless: bool = True, debug_slowmo_ms: int = 0):
+        self.headless = headless
+        self.debug_slowmo_ms = debug_slowmo_ms
+        self._pw: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        # 확인~기동 사이에 await가 있으므로, 동시에 불린 get()(예열 + 크롤링 등)이 각자 띄우지 않게 직렬화
+        self._launch_lock = asyncio.Lock()
+
+    async def get(self) -> Browser:
+        async with self._launch_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._pw is None:
+                    self._pw = await async_playwright().start()
+                self._browser = await launch_browser(self._pw, self.headless, self.debug_slowmo_ms)
+            return self._browser
+
+    async def reset(self) -> None:
+        """실행 실패 후 브라우저 상태를 신뢰할 수 없을 때 닫아서 다음 get()에서 재실행."""
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+    async def close(self) -> None:
+        await self.reset()
+        pw, self._pw = self._pw, None
+        if pw is not None:
+            await pw.stop()
+
+
+class PagePool:
+    """
+    상세 수집용 탭 풀 (한 context 안에서 동시 슬롯 수만큼만 탭을 만들고 항목 간에 재사용).
+    - acquire()는 빈 슬롯이 날 때까지 기다렸다가 쉬고 있는 탭(없으면 새 탭)을 빌려준다.
+    - 블록이 예외로 끝났거나 탭이 닫힌 경우 그 탭은 버리고, 다음 acquire()에서 새로 만든다.
+    """
+
+    def __init__(self, context: BrowserContext, size: int):
+        self._context = context
+        self._slots = asyncio.Semaphore(max(size, 1))
+        self._idle: List[Page] = []
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        async with self._slots:
+            page = self._idle.pop() if self._idle else await self._context.new_page()
+            reusable = False
+            try:
+                yield page
+                reusable = not page.is_closed()
+            finally:
+                if reusable:
+                    self._idle.append(page)
+                else:
+                    await _close_quietly(page)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for page in idle:
+            await _close_quietly(page)
+
+
+async def _close_quietly(page: Page) -> None:
+    try:
+        await page.close()
+    except PlaywrightError:
+        pass
+
+
+async def _save_storage_state(context: BrowserContext, state_file: StrPath) -> None:
+    try:
+        await context.storage_state(path=state_file)
+    except Exception:
+        log.warning("브라우저 상태 저장 실패: %s", state_file, exc_info=True)
 
 
 async def crawl_once(
     cfg: CrawlConfig,
     run_id: str,
-    out_raw_list: Path,
-    out_normalized: Path,
-    errors_dir: Path,
-    state_db: Path,
+    out_raw_list: StrPath,
+    out_normalized: StrPath,
+    errors_dir: StrPath,
+    state_db: StrPath,
     headless: bool,
     max_pages: int,
     max_items: int,
     keywords: List[str],
     list_only: bool = False,
     debug_slowmo_ms: int = 0,
+    browser: Optional[Browser] = None,
+    state_file: Optional[StrPath] = None,
 ) -> None:
+    """
+    목록/상세 1회 수집.
+    - browser를 넘기면 해당 브라우저에 새 context만 만들어 사용하고 닫지 않는다(재사용).
+    - 없으면 Playwright/Chromium을 직접 띄우고 종료 시 닫는다.
+    - state_file을 주면 쿠키/localStorage를 실행 간에 저장/복원한다 (Playwright storage_state).
+    """
     state = StateStore(state_db)
-    raw_writer = JsonlWriter(out_raw_list)
-    norm_writer = JsonlWriter(out_normalized)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=headless, slow_mo=debug_slowmo_ms)
-        context = await browser.new_context()
-        page = await context.new_page()
-
-        await navigate_to_bid_list(page, cfg)
-
-        start_page = int(state.get_checkpoint("bid_list.page") or "1")
-        current_page = start_page
-        processed_this_run = 0
-
-        log.info("시작: page=%d, processed=0/%d", current_page, max_items)
-
-        while current_page <= max_pages and processed_this_run < max_items:
-            state.set_checkpoint("bid_list.page", str(current_page))
-            items = await extract_list_items(page, cfg, limit=max_items - processed_this_run)
-            if not items:
-                log.warning("페이지 %d에서 추출된 항목 없음", current_page)
-
-            # 키워드 필터(제목/row_text 기준)
-            if keywords:
-                def _match(it: ListItem) -> bool:
-                    hay = (it.title or "") + "\n" + (it.raw_text or "")
-                    return any(k in hay for k in keywords)
-
-                items = [it for it in items if _match(it)]
-
-            # raw 목록 저장
-            for it in items:
-                raw_writer.write_one(it.model_dump())
-                state.mark_seen(it.notice_id, utc_now_iso())
-
-            if list_only:
-                processed_this_run += len(items)
-                # 상세 수집은 생략하고 다음 페이지로만 진행
-                # (아래 페이지네이션 로직을 그대로 사용)
-            else:
-                for it in items:
-                    if processed_this_run >= max_items:
-                        break
-                    if state.is_processed(it.notice_id):
-                        continue
+    # 목록/상세 출력은 각자 기록 태스크와 버퍼를 가진다 (서로 디스크 대기를 막지 않음)
+    raw_writer = QueuedJsonlWriter(
+        AsyncJsonlWriter(
+            out_raw_list, flush_every=cfg.flush_every, flush_interval_sec=cfg.flush_interval_sec
+        )
+    )
+    norm_writer = QueuedJsonlWriter(
+        AsyncJsonlWriter(
+            out_normalized, flush_every=cfg.flush_every, flush_interval_sec=cfg.flush_interval_sec
+        )
+    )
+    # 상세 레코드가 파일에 기록된 뒤에만 ok로 표시 (at-least-once: 중단 시 재수집)
+    pending_ok: List[Tuple[str, str, str]] = []
 
-                    try:
-                        # 상세 진입/추출은 실패가 잦을 수 있어 개별 재시도
-                        await _open_detail(page, it)
-                        await _wait_any_selector(page, cfg.detail_ready_selectors, timeout_ms=15000)
-                        await page.wait_for_timeout(1500)
-                        kv = await extract_detail_kv(page, cfg)
-                        html = await page.content()
-                        content_hash = sha256_text(html)
-
-                        prev_hash = state.get_content_hash(it.notice_id)
-                        state.upsert_processed(it.notice_id, "ok", utc_now_iso(), content_hash=content_hash)
-
-                        rec = NoticeRecord(
-                            source=SourceMeta(collected_at_utc=utc_now_iso(), run_id=run_id),
-                            notice={
-                                "notice_id": it.notice_id,
-                                "title": it.title,
-                                "detail_url": page.url,
-                                "list_parsed": it.raw.get("parsed", {}),
-                                "detail_fields": kv,
-                                "updated": bool(prev_hash and prev_hash != content_hash),
-                            },
-                            raw={
-                                "list_item": it.model_dump(),
-                                "html_sha256": content_hash,
-                            },
-                        )
-                        norm_writer.write_one(rec.model_dump())
-                        processed_this_run += 1
-                    except Exception as e:
-                        log.exception("detail failed: %s", it.notice_id)
-                        state.upsert_processed(it.notice_id, "error", utc_now_iso())
-                        await save_evidence(errors_dir, it.notice_id, page, e)
-                    finally:
-                        # 목록으로 복귀(뒤로가기), 실패하면 다시 목록 네비게이션
-                        try:
-                            await page.go_back(wait_until="domcontentloaded", timeout=15000)
-                            await _goto_or_recover_list(page, cfg)
-                        except Exception:
-                            await navigate_to_bid_list(page, cfg)
-
-            # 다음 페이지로 이동 (가능한 경우)
-            moved = False
-            await page.wait_for_timeout(500)  # 목록 복귀 후 안정화
-
-            # 0) 페이지 번호 링크 직접 클릭 (next/nextPage 버튼 혼동 방지)
-            next_page_num = current_page + 1
+    def _mark_written_ok() -> None:
+        if not pending_ok:
+            return
+        with state.batch():
+            for notice_id, seen_utc, content_hash in pending_ok:
+                state.upsert_processed(notice_id, "ok", seen_utc, content_hash=content_hash)
+        pending_ok.clear()
+
+    async def _flush_outputs(page_no: int) -> None:
+        """파일 기록을 마친 뒤 ok 표시와 페이지 체크포인트를 한 트랜잭션으로 커밋."""
+        await asyncio.gather(raw_writer.flush(), norm_writer.flush())
+        with state.batch():
+            _mark_written_ok()
+            state.flush_errors()
+            state.set_checkpoint("bid_list.page", str(page_no))
+
+    # 상세 결과 기록 (await 없이 끝나므로 동시 태스크 사이에서도 한 번에 실행됨)
+    def _record_detail(it: ListItem, kv: Dict[str, Any], content_hash: str, detail_url: str) -> None:
+        nonlocal processed_this_run
+        prev_hash = state.get_content_hash(it.notice_id)
+        rec = NoticeRecord(
+            source=SourceMeta(collected_at_utc=utc_now_iso(), run_id=run_id),
+            notice={
+                "notice_id": it.notice_id,
+                "title": it.title,
+                "detail_url": detail_url,
+                "list_parsed": it.raw.get("parsed", {}),
+                "detail_fields": kv,
+                "updated": bool(prev_hash and prev_hash != content_hash),
+            },
+            raw={
+                "list_item": it,
+                "html_sha256": content_hash,
+            },
+        )
+        norm_writer.put(rec)
+        pending_ok.append((it.notice_id, utc_now_iso(), content_hash))
+        processed_ids.add(it.notice_id)
+        processed_this_run += 1
+
+    async def _collect_detail(pg: Page, it: ListItem) -> None:
+        await _wait_any_selector(pg, cfg.detail_ready_selectors, timeout_ms=15000)
+        # 상세 값은 후속 XHR로 채워짐: 네트워크가 잠잠해질 때까지(최대 5초) 대기
+        try:
+            await pg.wait_for_load_state("networkidle", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+        kv = await extractor.extract(pg)
+        _record_detail(it, kv, await page_content_hash(pg), pg.url)
+
+    async def _detail_failed(pg: Page, it: ListItem, e: Exception) -> None:
+        if isinstance(e, TRANSIENT_EXC):
+            # 시간 초과/연결 오류: 다음 실행에서 다시 시도되므로 스택 없이 기록
+            log.warning("detail failed (transient): %s: %s", it.notice_id, e)
+        else:
+            log.exception("detail failed: %s", it.notice_id)
+        nonlocal errors_this_run
+        now = utc_now_iso()
+        state.mark_error(it.notice_id, now)
+        state.add_error(
+            now,
+            run_id,
+            it.notice_id,
+            type(e).__name__,
+            str(e),
+            "".join(traceback.format_exception(e)),
+            pg.url,
+        )
+        errors_this_run += 1
+        await save_evidence(errors_dir, it.notice_id, pg)
+        if cfg.hard_fail:
+            # 기록은 남기고 실행 중단: TaskGroup이 나머지 상세 태스크를 취소한다
+            raise e
+
+    async def _collect_detail_http(tab: Page, it: ListItem) -> bool:
+        """HTTP로 받은 상세 HTML을 탭에 넣고 추출. 바로 쓸 수 없는 페이지면 False (브라우저 이동으로 대체)."""
+        html = await fetch_detail_html(http_client, it.detail_url)
+        if html is None:
+            return False
+        await tab.set_content(html, wait_until="domcontentloaded")
+        try:
+            await _wait_any_selector(tab, cfg.detail_ready_selectors, timeout_ms=1000)
+        except ElementNotFoundError:
+            log.debug("HTTP 상세에 내용 없음(JS 렌더 필요), 브라우저로 대체: %s", it.detail_url)
+            return False
+        kv = await extractor.extract(tab)
+        # 응답 원문이 아니라 탭의 DOM을 해시: 브라우저 수집과 같은 입력이라 detail.mode를 바꿔도 updated가 흔들리지 않음
+        _record_detail(it, kv, await page_content_hash(tab), it.detail_url)
+        return True
+
+    async def _detail_in_pool(pool: PagePool, it: ListItem) -> None:
+        async with pool.acquire() as tab:
             try:
-                page_link = page.locator(
-                    f"a[id*='pagelist_page_'][index='{next_page_num}']"
-                )
-                if await page_link.count() > 0:
-                    await page_link.first.scroll_into_view_if_needed(timeout=5000)
-                    await page_link.first.click(timeout=8000)
-                    await _goto_or_recover_list(page, cfg)
-                    moved = True
-                    log.info("다음 페이지로 이동 (page link): %d", next_page_num)
-            except Exception:
-                pass
-            if moved:
-                current_page += 1
-                continue
-
-            # 1) CSS 선택자 우선 (누리장터 w2pageList 등 커스텀 페이지네이션)
-            for sel in cfg.next_button_selector_candidates:
-                try:
-                    loc = page.locator(sel)
-                    if await loc.count() > 0:
-                        await loc.first.scroll_into_view_if_needed(timeout=5000)
-                        await loc.first.click(timeout=8000)
-                        await _goto_or_recover_list(page, cfg)
-                        moved = True
-                        log.info("다음 페이지로 이동 (selector): %s", sel)
-                        break
-                except Exception:
-                    continue
-            if moved:
-                current_page += 1
-                continue
-
-            # 2) role/text 기반 폴백
-            for name in cfg.next_button_name_candidates:
-                for strategy in [
-                    lambda n: page.get_by_role("button", name=n),
-                    lambda n: page.get_by_role("link", name=n),
-                    lambda n: page.get_by_text(n, exact=True),
-                ]:
+                if http_client is not None and await _collect_detail_http(tab, it):
+                    return
+                # 풀 탭에는 목록 그리드가 없으므로 클릭 대체 없이 URL로만 진입 (goto 오류는 그대로 _detail_failed로)
+                await tab.goto(it.detail_url, wait_until="domcontentloaded", timeout=20000)
+                await _collect_detail(tab, it)
+            except Exception as e:
+                await _detail_failed(tab, it, e)
+
+    async def _details_on_list_page(
+        page: Page, items: List[ListItem], inline_details: Dict[str, Dict[str, Any]]
+    ) -> None:
+        for it in items:
+            inline = inline_details.get(it.notice_id)
+            shown = page  # 상세가 표시된 탭
+            try:
+                if inline is not None:
+                    # 목록에 이미 펼쳐진 상세: 이동 없이 같은 추출 결과를 사용
+                    kv = extractor.finish(inline)
+                    content_hash = sha256_text(inline.get("html") or "")
+                    _record_detail(it, kv, content_hash, it.detail_url or page.url)
+                else:
+                    # 상세 진입/추출은 실패가 잦을 수 있어 개별 재시도
+                    shown = await _open_detail(page, it)
+                    await _collect_detail(shown, it)
+            except Exception as e:
+                await _detail_failed(shown, it, e)
+            finally:
+                if shown is not page:
+                    # 새 탭으로 열린 상세: 탭만 닫으면 목록은 그대로
+                    await shown.close()
+                elif inline is None:
+                    # 같은 화면에서 열린 상세: 목록으로 복귀(뒤로가기), 실패하면 다시 목록 네비게이션
                     try:
-                        loc = strategy(name)
-                        if await loc.count() > 0:
-                            await loc.first.scroll_into_view_if_needed(timeout=5000)
-                            await loc.first.click(timeout=8000)
-                            await _goto_or_recover_list(page, cfg)
-                            moved = True
-                            log.info("다음 페이지로 이동: %s", name)
-                            break
+                        await page.go_back(wait_until="domcontentloaded", timeout=15000)
+                        await _goto_or_recover_list(page, cfg)
                     except Exception:
-                        continue
-                if moved:
-                    break
-
-            if not moved:
-                log.info("다음 페이지 없음, 종료")
-                break
+                        await navigate_to_bid_list(page, cfg)
 
-            current_page += 1
+    extractor = DetailExtractor(cfg)
+    http_client: Optional["httpx.AsyncClient"] = None
+    processed_this_run = 0
+    errors_this_run = 0
+    # 이미 수집한(ok) 공고는 한 번에 읽어 두고 메모리에서 건너뜀
+    processed_ids = state.load_processed_ids()
 
-        await context.close()
-        await browser.close()
+    try:
+        async with AsyncExitStack() as stack:
+            if browser is None:
+                p = await stack.enter_async_context(async_playwright())
+                browser = await launch_browser(p, headless, debug_slowmo_ms)
+                stack.push_async_callback(browser.close)
+            storage_state = None
+            if state_file is not None and os.path.exists(state_file):
+                storage_state = os.fspath(state_file)
+            context = await browser.new_context(storage_state=storage_state)
+            await block_heavy_resources(context, cfg.block_resource_types)
+            stack.push_async_callback(context.close)
+            if state_file is not None:
+                # context.close 전에 실행되도록 나중에 등록 (LIFO)
+                stack.push_async_callback(_save_storage_state, context, state_file)
+            page = await context.new_page()
+            # URL로 바로 열 수 있는 상세는 슬롯(detail_concurrency)만큼의 탭을 돌려 쓰며 동시 수집
+            detail_pool = PagePool(context, cfg.detail_concurrency)
+            stack.push_async_callback(detail_pool.close)
+
+            await open_bid_list(page, cfg, state)
+            if cfg.detail_mode == "http":
+                # 목록 진입 후의 쿠키(세션)를 넘겨받아야 상세 요청이 같은 세션으로 나간다
+                http_client = await stack.enter_async_context(await _open_http_client(context, cfg))
+
+            start_page = int(state.get_checkpoint("bid_list.page") or "1")
+            current_page = start_page
+
+            log.info("시작: page=%d, processed=0/%d", current_page, max_items)
+
+            while current_page <= max_pages and processed_this_run < max_items:
+                # 체크포인트 경계에서 이전 페이지 결과를 디스크로 내보냄
+                await _flush_outputs(current_page)
+                items, inline_details = await extract_list_page(
+                    page, cfg, limit=max_items - processed_this_run, extractor=extractor
+                )
+                if not items:
+                    log.warning("페이지 %d에서 추출된 항목 없음", current_page)
+
+                # 키워드 필터(제목/row_text 기준)
+                if keywords:
+                    def _match(it: ListItem) -> bool:
+                        hay = (it.title or "") + "\n" + (it.raw_text or "")
+                        return any(k in hay for k in keywords)
+
+                    items = [it for it in items if _match(it)]
+
+                # raw 목록 저장
+                seen_utc = utc_now_iso()
+                raw_writer.put_many(items)
+                state.mark_seen_batch([(it.notice_id, seen_utc) for it in items])
+
+                if list_only:
+                    processed_this_run += len(items)
+                    # 상세 수집은 생략하고 다음 페이지로만 진행
+                    # (아래 페이지네이션 로직을 그대로 사용)
+                else:
+                    # 실제 URL이 있는 공고는 별도 탭에서 동시 수집, 클릭 진입/인라인 상세는 목록 탭에서 순차 처리
+                    in_tabs: List[ListItem] = []
+                    on_list: List[ListItem] = []
+                    for it in items:
+                        if it.notice_id in processed_ids:
+                            continue
+                        if it.notice_id not in inline_details and _is_navigable_url(it.detail_url):
+                            in_tabs.append(it)
+                        else:
+                            on_list.append(it)
+                    # 항목별 실패는 각 태스크 안에서 기록/격리하고, hard_fail일 때만 전체를 중단
+                    try:
+                        async with asyncio.TaskGroup() as tg:
+                            tg.create_task(_details_on_list_page(page, on_list, inline_details))
+                            for it in in_tabs:
+                                tg.create_task(_detail_in_pool(detail_pool, it))
+                    except ExceptionGroup as eg:
+                        raise eg.exceptions[0] from eg
+
+                # 다음 페이지로 이동 (가능한 경우)
+                if not await go_to_next_page(page, cfg, current_page):
+                    log.info("다음 페이지 없음, 종료")
+                    break
 
-        log.info(
-            "크롤링 완료: raw=%s, normalized=%s, processed=%d",
-            out_raw_list,
-            out_normalized,
-            processed_this_run,
-        )
+                current_page += 1
 
+            log.info(
+                "크롤링 완료: raw=%s, normalized=%s, processed=%d",
+                out_raw_list,
+                out_normalized,
+                processed_this_run,
+            )
+    finally:
+        # 큐/버퍼에 남은 레코드까지 기록한 뒤 ok 표시.
+        # StateStore는 경로별로 공유되는 연결이라 닫지 않는다 (다음 회차가 재사용, 종료 시 atexit).
+        try:
+            await raw_writer.close()
+        finally:
+            await norm_writer.close()
+        _mark_written_ok()
+        if errors_this_run:
+            # 이번 회차 오류를 파일 하나로 내보냄 (errors_dir를 보던 기존 흐름 호환)
+            state.export_errors(errors_dir, run_id)
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
 
-
-class SourceMeta(BaseModel):
+# 검증 없는 단순 레코드: orjson이 dataclass를 직접 직렬화한다 (model_dump 단계 없음)
+@dataclass(slots=True, kw_only=True)
+class SourceMeta:
     site: str = "nuri.g2b.go.kr"
     collected_at_utc: str
     run_id: str
 
 
-class ListItem(BaseModel):
+@dataclass(slots=True)
+class ListItem:
     notice_id: str
     title: Optional[str] = None
     organization: Optional[str] = None
@@ -20,11 +21,11 @@ class ListItem(BaseModel):
     deadline_at: Optional[str] = None
     detail_url: Optional[str] = None
     raw_text: Optional[str] = None
-    raw: Dict[str, Any] = Field(default_factory=dict)
+    raw: Dict[str, Any] = field(default_factory=dict)
 
 
-class NoticeRecord(BaseModel):
+@dataclass(slots=True)
+class NoticeRecord:
     source: SourceMeta
     notice: Dict[str, Any]
-    raw: Dict[str, Any] = Field(default_factory=dict)
-
+    raw: Dict[str, Any] = field(default_factory=dict)
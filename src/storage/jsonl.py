@@ -1,21 +1,161 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, BinaryIO, Iterable, Optional
 
+import orjson
 
-class JsonlWriter:
-    def __init__(self, path: Path):
-        self.path = path
+from src.utils.paths import StrPath
+
+# orjson은 UTF-8 bytes를 바로 반환하므로 별도 encode/개행 연결이 필요 없다.
+_DUMPS_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+class AsyncJsonlWriter:
+    """
+    JSON Lines append writer (asyncio용).
+    - 직렬화/버퍼링은 이벤트 루프에서 하고, 파일 open/write/close는 asyncio.to_thread로
+      워커 스레드에서 처리해 디스크 대기가 상세 수집 등 다른 태스크를 막지 않게 한다.
+    - 버퍼가 flush_bytes(기본 64KB)를 넘거나 flush_every건/flush_interval_sec초가 지나면 한 번에 기록.
+    - 첫 기록 시점에 파일을 열어, 기록이 없으면 파일도 만들지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: StrPath,
+        flush_bytes: int = 1 << 16,
+        flush_every: int = 200,
+        flush_interval_sec: float = 5.0,
+        buffer_size: int = 1 << 16,
+    ):
+        self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_bytes = flush_bytes
+        self.flush_every = max(flush_every, 1)
+        self.flush_interval_sec = flush_interval_sec
+        self.buffer_size = buffer_size
+        self._f: Optional[BinaryIO] = None
+        self._buf = bytearray()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        # 스레드로 넘긴 기록이 순서대로 끝나도록 파일 I/O는 한 번에 하나만
+        self._io_lock = asyncio.Lock()
+
+    def _append(self, obj: Any) -> None:
+        self._buf += orjson.dumps(obj, option=_DUMPS_OPTIONS)
+        self._pending += 1
+
+    def _due(self) -> bool:
+        return (
+            len(self._buf) >= self.flush_bytes
+            or self._pending >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval_sec
+        )
+
+    async def write(self, obj: Any) -> None:
+        self._append(obj)
+        if self._due():
+            await self.flush()
+
+    async def write_many(self, objs: Iterable[Any]) -> None:
+        for obj in objs:
+            self._append(obj)
+        if self._due():
+            await self.flush()
+
+    def _write_sync(self, data: bytes, fsync: bool) -> None:
+        if self._f is None:
+            if not data:
+                return
+            self._f = self.path.open("ab", buffering=self.buffer_size)
+        if data:
+            self._f.write(data)
+        self._f.flush()
+        if fsync:
+            os.fsync(self._f.fileno())
+
+    async def flush(self, fsync: bool = False) -> None:
+        self._last_flush = time.monotonic()
+        data = bytes(self._buf)
+        self._buf.clear()
+        self._pending = 0
+        async with self._io_lock:
+            await asyncio.to_thread(self._write_sync, data, fsync)
+
+    async def close(self) -> None:
+        try:
+            await self.flush()
+        finally:
+            f, self._f = self._f, None
+            if f is not None:
+                async with self._io_lock:
+                    await asyncio.to_thread(f.close)
+
+    async def __aenter__(self) -> "AsyncJsonlWriter":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+
+class QueuedJsonlWriter:
+    """
+    AsyncJsonlWriter를 전용 asyncio 태스크에서 돌리는 래퍼.
+    - 생산자는 put()으로 큐에 넣고 바로 다음 작업을 진행 (디스크 기록을 기다리지 않음).
+    - 스트림마다 태스크/버퍼가 따로라 목록(짧고 몰아서)과 상세(크고 드문) 기록이 서로 막지 않는다.
+    - 기록 태스크가 실패하면 다음 put/flush/close에서 그 예외를 생산자에게 올린다.
+    """
+
+    def __init__(self, writer: AsyncJsonlWriter):
+        self.writer = writer
+        self._q: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                item = await self._q.get()
+                if item is None:
+                    return
+                if isinstance(item, asyncio.Future):
+                    # flush 요청: 버퍼를 파일로 내보낸 뒤 완료 알림
+                    await self.writer.flush()
+                    if not item.done():
+                        item.set_result(None)
+                elif isinstance(item, list):
+                    await self.writer.write_many(item)
+                else:
+                    await self.writer.write(item)
+        finally:
+            await self.writer.close()
+
+    def _check(self) -> None:
+        if self._task.done():
+            self._task.result()
+            raise RuntimeError(f"writer for {self.writer.path} is closed")
+
+    def put(self, obj: Any) -> None:
+        self._check()
+        self._q.put_nowait(obj)
 
-    def write_one(self, obj: Dict[str, Any]) -> None:
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    def put_many(self, objs: Iterable[Any]) -> None:
+        """여러 레코드를 큐 항목 하나로 넘겨 한 번에 직렬화/기록."""
+        self._check()
+        self._q.put_nowait(list(objs))
 
-    def write_many(self, objs: Iterable[Dict[str, Any]]) -> None:
-        with self.path.open("a", encoding="utf-8") as f:
-            for obj in objs:
-                f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    async def flush(self) -> None:
+        """지금까지 put한 레코드가 모두 파일에 기록될 때까지 대기."""
+        self._check()
+        done = asyncio.get_running_loop().create_future()
+        self._q.put_nowait(done)
+        await asyncio.wait({done, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if not done.done():
+            self._check()
 
+    async def close(self) -> None:
+        if not self._task.done():
+            self._q.put_nowait(None)
+        await self._task
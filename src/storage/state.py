@@ -1,29 +1,179 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
+import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import orjson
+
+from src.utils.paths import StrPath
 
 
 def sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8", errors="ignore")).hexdigest()
 
 
+# 자주 쓰는 SQL은 모듈 상수로 고정: sqlite3는 SQL 문자열을 키로 준비된 문장(prepared statement)을
+# 연결 단위로 캐시하므로, 같은 문자열을 재사용하면 파싱/플랜을 매 호출마다 하지 않는다.
+# 체크포인트: 쓰기는 checkpoint_delta에 추가만(append-only) 하고, 주기적으로 최신값만
+# checkpoints(스냅샷)로 접어 넣는다. 조회는 최신 delta -> 스냅샷 순.
+_GET_CHECKPOINT_DELTA_SQL = "SELECT value FROM checkpoint_delta WHERE key = ? ORDER BY ts DESC LIMIT 1"
+
+_GET_CHECKPOINT_SQL = "SELECT value FROM checkpoints WHERE key = ?"
+
+# ts는 단조 증가: 남은 delta의 최댓값, 없으면 마지막 압축 시점(last_ts) 다음 번호
+_ADD_CHECKPOINT_DELTA_SQL = """
+INSERT INTO checkpoint_delta(ts, key, value)
+VALUES(
+  COALESCE(
+    (SELECT MAX(ts) FROM checkpoint_delta),
+    (SELECT last_ts FROM checkpoint_meta WHERE id = 1),
+    0
+  ) + 1,
+  ?, ?
+)
+"""
+
+_COMPACT_CHECKPOINTS_SQL = """
+INSERT INTO checkpoints(key, value)
+SELECT key, value FROM checkpoint_delta AS d
+WHERE d.ts <= :upto
+  AND d.ts = (SELECT MAX(ts) FROM checkpoint_delta WHERE key = d.key AND ts <= :upto)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+# delta가 이만큼 쌓이면 스냅샷으로 압축
+CHECKPOINT_COMPACT_EVERY = 256
+
+_IS_PROCESSED_SQL = "SELECT 1 FROM processed WHERE notice_id = ? AND status = 'ok'"
+
+_GET_CONTENT_HASH_SQL = "SELECT content_hash FROM processed WHERE notice_id = ?"
+
+_UPSERT_PROCESSED_SQL = """
+INSERT INTO processed(notice_id, status, content_hash, last_seen_utc)
+VALUES(?, ?, ?, ?)
+ON CONFLICT(notice_id) DO UPDATE SET
+  status = excluded.status,
+  content_hash = COALESCE(excluded.content_hash, processed.content_hash),
+  last_seen_utc = excluded.last_seen_utc
+"""
+
+_MARK_SEEN_SQL = """
+INSERT INTO processed(notice_id, status, content_hash, last_seen_utc)
+VALUES(?, 'seen', NULL, ?)
+ON CONFLICT(notice_id) DO UPDATE SET last_seen_utc = excluded.last_seen_utc
+"""
+
+# 상세 실패 기록: 오류마다 파일을 만들지 않고 errors 테이블 한 곳에 행으로 쌓는다
+_INSERT_ERROR_SQL = """
+INSERT INTO errors(ts, run_id, notice_id, kind, message, traceback, url)
+VALUES(?, ?, ?, ?, ?, ?, ?)
+"""
+
+_ERROR_COLUMNS = ("ts", "run_id", "notice_id", "kind", "message", "traceback", "url")
+
+# 오류 행은 이만큼 모아서 커밋 한 번으로 기록
+ERROR_BATCH_SIZE = 32
+
+
 class StateStore:
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init()
+    """
+    처리 상태/체크포인트 저장소 (SQLite).
+    - DB 경로(절대경로)당 인스턴스 하나: 같은 경로로 다시 만들면 열려 있는 인스턴스를 돌려준다.
+      연결/PRAGMA/스키마 확인은 처음 한 번만 하고 interval 회차·UI 실행 간에 재사용한다.
+    - isolation_level=None(autocommit): 단건 쓰기는 문장 단위로 바로 반영되고,
+      여러 건을 묶을 때는 transaction()으로 한 번에 커밋한다.
+    - 열린 연결은 프로세스 종료 시(atexit) 닫는다. close()한 뒤에는 같은 경로로 새로 열 수 있다.
+    """
+
+    _instances: ClassVar[Dict[str, "StateStore"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
-        return conn
+    def __new__(cls, db_path: StrPath) -> "StateStore":
+        key = os.path.abspath(os.fspath(db_path))
+        with cls._instances_lock:
+            inst = cls._instances.get(key)
+            if inst is None:
+                inst = super().__new__(cls)
+                inst._key = key
+                inst._opened = False
+                cls._instances[key] = inst
+            return inst
+
+    def __init__(self, db_path: StrPath):
+        with self._instances_lock:
+            if self._opened:
+                return
+            self.db_path = Path(self._key)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(
+                self._key,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=256,
+            )
+            self.conn.execute("PRAGMA journal_mode=WAL;")
+            self.conn.execute("PRAGMA synchronous=NORMAL;")
+            # 임시 테이블/정렬은 메모리에서, 읽기는 mmap(256MB)으로, 페이지 캐시는 64MB
+            self.conn.execute("PRAGMA temp_store=MEMORY;")
+            self.conn.execute("PRAGMA mmap_size=268435456;")
+            self.conn.execute("PRAGMA cache_size=-65536;")
+            self._init()
+            self._opened = True
+
+    def close(self) -> None:
+        with self._instances_lock:
+            if self._instances.get(self._key) is self:
+                del self._instances[self._key]
+            if self._opened:
+                self._opened = False
+                self.flush_errors()
+                self.conn.close()
+
+    @classmethod
+    def close_all(cls) -> None:
+        for inst in list(cls._instances.values()):
+            inst.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        BEGIN IMMEDIATE ~ COMMIT 로 묶어 fsync를 한 번으로 줄인다. 예외 시 ROLLBACK.
+        - 이미 열린 트랜잭션 안에서 호출되면 새로 열지 않고 바깥 트랜잭션에 합류한다.
+        - ROLLBACK 시 메모리의 ok 집합도 DB 기준으로 다시 읽는다 (되돌려진 ok 표시가 남지 않게).
+        """
+        if self.conn.in_transaction:
+            yield self.conn
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            if self._opened:
+                self._reload_ok_ids()
+            raise
+        self.conn.execute("COMMIT")
+
+    @contextmanager
+    def batch(self) -> Iterator["StateStore"]:
+        """
+        여러 상태 쓰기(upsert_processed/set_checkpoint/mark_seen_batch 등)를 커밋 한 번으로 묶는다.
+
+            with store.batch():
+                store.upsert_processed(...)
+                store.set_checkpoint("bid_list.page", "3")
+        """
+        with self.transaction():
+            yield self
 
     def _init(self) -> None:
-        with self._connect() as conn:
+        with self.transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS processed (
@@ -34,6 +184,7 @@ class StateStore:
                 )
                 """
             )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_processed_status ON processed(status)")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS checkpoints (
@@ -42,47 +193,109 @@ class StateStore:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoint_delta (
+                  ts INTEGER NOT NULL,
+                  key TEXT NOT NULL,
+                  value TEXT NOT NULL,
+                  PRIMARY KEY (ts, key)
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_checkpoint_delta_key ON checkpoint_delta(key, ts)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoint_meta (
+                  id INTEGER PRIMARY KEY CHECK (id = 1),
+                  last_ts INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS errors (
+                  id INTEGER PRIMARY KEY,
+                  ts TEXT NOT NULL,
+                  run_id TEXT NOT NULL,
+                  notice_id TEXT NOT NULL,
+                  kind TEXT NOT NULL,
+                  message TEXT NOT NULL,
+                  traceback TEXT,
+                  url TEXT
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_errors_run ON errors(run_id)")
+        self._pending_deltas = self.conn.execute("SELECT COUNT(*) FROM checkpoint_delta").fetchone()[0]
+        self._reload_ok_ids()
+        self._pending_errors: List[Tuple[str, str, str, str, str, Optional[str], Optional[str]]] = []
+
+    def _reload_ok_ids(self) -> None:
+        # ok 공고 ID를 메모리에 올려 두고 is_processed의 '아님' 판정은 SQL 없이 끝낸다
+        self._ok_ids: Set[str] = {
+            r[0] for r in self.conn.execute("SELECT notice_id FROM processed WHERE status = 'ok'")
+        }
 
     def get_checkpoint(self, key: str) -> Optional[str]:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT value FROM checkpoints WHERE key = ?", (key,)
-            ).fetchone()
-            return row[0] if row else None
+        row = self.conn.execute(_GET_CHECKPOINT_DELTA_SQL, (key,)).fetchone()
+        if row is None:
+            row = self.conn.execute(_GET_CHECKPOINT_SQL, (key,)).fetchone()
+        return row[0] if row else None
 
     def set_checkpoint(self, key: str, value: str) -> None:
-        with self._connect() as conn:
+        """기존 행을 고쳐 쓰지 않고 delta 한 줄을 추가. 일정 개수가 쌓이면 스냅샷으로 압축."""
+        self.conn.execute(_ADD_CHECKPOINT_DELTA_SQL, (key, value))
+        self._pending_deltas += 1
+        if self._pending_deltas >= CHECKPOINT_COMPACT_EVERY:
+            self.compact_checkpoints()
+
+    def compact_checkpoints(self) -> None:
+        """
+        지금까지의 delta를 키별 최신값만 checkpoints 스냅샷에 반영하고 삭제한다.
+        압축한 마지막 ts는 checkpoint_meta.last_ts로 남겨 이후 delta 번호가 이어지게 한다.
+        """
+        with self.transaction() as conn:
+            upto = conn.execute("SELECT MAX(ts) FROM checkpoint_delta").fetchone()[0]
+            if upto is None:
+                self._pending_deltas = 0
+                return
+            conn.execute(_COMPACT_CHECKPOINTS_SQL, {"upto": upto})
+            conn.execute("DELETE FROM checkpoint_delta WHERE ts <= ?", (upto,))
             conn.execute(
                 """
-                INSERT INTO checkpoints(key, value)
-                VALUES(?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                INSERT INTO checkpoint_meta(id, last_ts) VALUES(1, ?)
+                ON CONFLICT(id) DO UPDATE SET last_ts = excluded.last_ts
                 """,
-                (key, value),
+                (upto,),
             )
+        self._pending_deltas = 0
 
     def is_processed(self, notice_id: str) -> bool:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT 1 FROM processed WHERE notice_id = ? AND status = 'ok'",
-                (notice_id,),
-            ).fetchone()
-            return row is not None
+        """
+        ok 상태인지 확인. 메모리 집합에 없으면 바로 False(재개 시 대부분의 목록 항목),
+        있으면 다른 프로세스가 같은 DB를 고쳤을 수 있으므로 DB로 한 번 더 확인한다.
+        """
+        if notice_id not in self._ok_ids:
+            return False
+        row = self.conn.execute(_IS_PROCESSED_SQL, (notice_id,)).fetchone()
+        return row is not None
+
+    def load_processed_ids(self) -> Set[str]:
+        """ok 상태 공고 ID 전체 (복사본). 호출자가 고쳐도 저장소의 집합에는 영향 없음."""
+        return set(self._ok_ids)
 
     def mark_seen(self, notice_id: str, last_seen_utc: str) -> None:
         """
         목록 단계에서 발견한 공고를 기록.
         - 상세 수집 성공 여부와 무관하게 'seen' 상태로 남겨 중복 방지/재개 판단에 활용.
         """
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO processed(notice_id, status, content_hash, last_seen_utc)
-                VALUES(?, 'seen', NULL, ?)
-                ON CONFLICT(notice_id) DO UPDATE SET last_seen_utc = excluded.last_seen_utc
-                """,
-                (notice_id, last_seen_utc),
-            )
+        self.conn.execute(_MARK_SEEN_SQL, (notice_id, last_seen_utc))
+
+    def mark_seen_batch(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """(notice_id, last_seen_utc) 여러 건을 한 트랜잭션(executemany)으로 기록."""
+        with self.transaction() as conn:
+            conn.executemany(_MARK_SEEN_SQL, pairs)
 
     def upsert_processed(
         self,
@@ -91,24 +304,66 @@ class StateStore:
         last_seen_utc: str,
         content_hash: Optional[str] = None,
     ) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO processed(notice_id, status, content_hash, last_seen_utc)
-                VALUES(?, ?, ?, ?)
-                ON CONFLICT(notice_id) DO UPDATE SET
-                  status = excluded.status,
-                  content_hash = COALESCE(excluded.content_hash, processed.content_hash),
-                  last_seen_utc = excluded.last_seen_utc
-                """,
-                (notice_id, status, content_hash, last_seen_utc),
-            )
+        self.conn.execute(_UPSERT_PROCESSED_SQL, (notice_id, status, content_hash, last_seen_utc))
+        if status == "ok":
+            self._ok_ids.add(notice_id)
+        else:
+            self._ok_ids.discard(notice_id)
+
+    def mark_error(self, notice_id: str, last_seen_utc: str) -> None:
+        """상세 진입/파싱 실패 기록 (이전 content_hash는 유지, 다음 실행에서 다시 수집 대상)."""
+        self.upsert_processed(notice_id, "error", last_seen_utc)
+
+    def add_error(
+        self,
+        ts: str,
+        run_id: str,
+        notice_id: str,
+        kind: str,
+        message: str,
+        traceback: Optional[str] = None,
+        url: Optional[str] = None,
+    ) -> None:
+        """
+        실패 한 건을 errors 테이블용으로 버퍼에 쌓는다.
+        - ERROR_BATCH_SIZE건마다 한 트랜잭션으로 기록. 남은 행은 flush_errors()/export_errors()/close()에서 기록.
+        """
+        self._pending_errors.append((ts, run_id, notice_id, kind, message, traceback, url))
+        if len(self._pending_errors) >= ERROR_BATCH_SIZE:
+            self.flush_errors()
+
+    def flush_errors(self) -> None:
+        if not self._pending_errors:
+            return
+        rows, self._pending_errors = self._pending_errors, []
+        with self.batch():
+            self.conn.executemany(_INSERT_ERROR_SQL, rows)
+
+    def export_errors(self, errors_dir: StrPath, run_id: Optional[str] = None) -> Optional[Path]:
+        """
+        errors 테이블을 errors_dir/errors_<run_id>.jsonl 로 내보낸다 (run_id 없으면 전체, errors_all.jsonl).
+        - 파일 기반으로 오류를 보던 기존 흐름을 위한 호환용. 내보낼 행이 없으면 파일을 만들지 않고 None.
+        """
+        self.flush_errors()
+        sql = f"SELECT {', '.join(_ERROR_COLUMNS)} FROM errors"
+        params: Tuple[str, ...] = ()
+        if run_id is not None:
+            sql += " WHERE run_id = ?"
+            params = (run_id,)
+        rows = self.conn.execute(sql + " ORDER BY id", params).fetchall()
+        if not rows:
+            return None
+        out_dir = Path(errors_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out = out_dir / f"errors_{run_id or 'all'}.jsonl"
+        out.write_bytes(
+            b"".join(orjson.dumps(dict(zip(_ERROR_COLUMNS, r)), option=orjson.OPT_APPEND_NEWLINE) for r in rows)
+        )
+        return out
 
     def get_content_hash(self, notice_id: str) -> Optional[str]:
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT content_hash FROM processed WHERE notice_id = ?",
-                (notice_id,),
-            ).fetchone()
-            return row[0] if row else None
+        row = self.conn.execute(_GET_CONTENT_HASH_SQL, (notice_id,)).fetchone()
+        return row[0] if row else None
+
 
+atexit.register(StateStore.close_all)
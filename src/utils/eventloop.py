@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+
+def install_fast_event_loop() -> bool:
+    """
+    uvloop이 설치되어 있으면 asyncio 이벤트 루프 정책으로 설치한다.
+    - uvloop은 POSIX 전용이므로 Windows에서는 기본 Proactor 루프(서브프로세스 I/O 지원)를 유지.
+    - 설치되지 않은 환경에서는 아무 것도 하지 않는다.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
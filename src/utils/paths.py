@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Set, Union
 
+# 크롤러 API는 str / PathLike 경로를 모두 받는다
+StrPath = Union[str, "os.PathLike[str]"]
 
+
+@lru_cache(maxsize=1)
 def workspace_root() -> Path:
     # src/ 기준 2단계 위 = 프로젝트 루트
     return Path(__file__).resolve().parents[2]
 
 
+# 이 프로세스에서 이미 생성/확인한 디렉터리 (반복 실행 시 mkdir syscall 생략)
+_KNOWN_DIRS: Set[str] = set()
+
+
 def ensure_dir(p: Path) -> Path:
-    p.mkdir(parents=True, exist_ok=True)
+    key = os.fspath(p)
+    if key not in _KNOWN_DIRS:
+        p.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(key)
     return p
 
+
+def jsonl_basename(name: str, default: str) -> str:
+    """출력 파일명 입력값 정리: 공백 제거, 비어 있으면 default, .jsonl 확장자(대소문자 무관)는 떼어냄."""
+    name = name.strip()
+    if not name:
+        return default
+    if name[-6:].lower() == ".jsonl":
+        return name[:-6]
+    return name
@@ -1,18 +1,104 @@
 from __future__ import annotations
 
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential_jitter,
-)
-
-
-def default_retry():
-    return retry(
-        reraise=True,
-        stop=stop_after_attempt(4),
-        wait=wait_exponential_jitter(initial=1, max=12),
-        retry=retry_if_exception_type(Exception),
-    )
+import asyncio
+import functools
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Type, TypeVar
 
+T = TypeVar("T")
+
+
+def _transient_exceptions() -> Tuple[Type[BaseException], ...]:
+    """
+    재시도할 가치가 있는 일시 오류(시간 초과/연결 오류)만 모은다.
+    - playwright/httpx는 설치된 경우에만 포함 (이 모듈만 쓰는 곳에서 무거운 import를 강제하지 않음).
+    - asyncio.TimeoutError는 3.11부터 내장 TimeoutError와 같은 클래스.
+    """
+    classes: List[Type[BaseException]] = [asyncio.TimeoutError, TimeoutError, ConnectionError]
+    try:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    except ImportError:
+        pass
+    else:
+        classes.append(PlaywrightTimeoutError)
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        classes.append(httpx.TransportError)
+    return tuple(dict.fromkeys(classes))
+
+
+# 프로그래밍 오류/설정 오류 등은 바로 실패시키고, 이 목록에 든 예외만 재시도
+TRANSIENT_EXC: Tuple[Type[BaseException], ...] = _transient_exceptions()
+
+
+def _backoff_schedule(attempts: int, base: float, cap: float) -> Tuple[float, ...]:
+    """n번째 실패 후 기본 대기 시간: min(cap, base * 2**n). 마지막 시도 뒤에는 대기하지 않는다."""
+    return tuple(min(cap, base * (2.0**n)) for n in range(max(attempts - 1, 0)))
+
+
+# 기본 설정(4회, 1초, 최대 12초)의 대기 스케줄은 미리 계산: (1.0, 2.0, 4.0)
+_SCHED = _backoff_schedule(4, 1.0, 12.0)
+
+
+async def _run_with_schedule(
+    fn: Callable[..., Awaitable[T]],
+    args: Tuple[Any, ...],
+    kw: Dict[str, Any],
+    sched: Tuple[float, ...],
+    exc: Tuple[Type[BaseException], ...],
+) -> T:
+    # 재시도마다 곱셈 한 번(지터 0.5~1.5배)만 하고 대기 시간 계산은 스케줄에서 꺼내 쓴다
+    for delay in sched:
+        try:
+            return await fn(*args, **kw)
+        except exc:
+            await asyncio.sleep(delay * (0.5 + random.random()))
+    # 마지막 시도: 예외는 그대로 호출자에게
+    return await fn(*args, **kw)
+
+
+async def retry_async(
+    fn: Callable[..., Awaitable[T]],
+    *args: Any,
+    attempts: int = 4,
+    base: float = 1.0,
+    cap: float = 12.0,
+    exc: Tuple[Type[BaseException], ...] = TRANSIENT_EXC,
+    **kw: Any,
+) -> T:
+    """
+    fn(*args, **kw)를 최대 attempts번 시도. exc에 해당하는 예외면 지수 백오프 후 재시도하고,
+    마지막 시도의 예외는 그대로 올린다.
+    - 대기: min(cap, base * 2**n) * (0.5 ~ 1.5 지터), 항상 asyncio.sleep (이벤트 루프를 막지 않음).
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be >= 1")
+    if (attempts, base, cap) == (4, 1.0, 12.0):
+        sched = _SCHED
+    else:
+        sched = _backoff_schedule(attempts, base, cap)
+    return await _run_with_schedule(fn, args, kw, sched, exc)
+
+
+def default_retry(
+    attempts: int = 4,
+    base: float = 1.0,
+    cap: float = 12.0,
+    exc: Tuple[Type[BaseException], ...] = TRANSIENT_EXC,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """async 함수용 재시도 데코레이터 (대기 스케줄은 데코레이트 시점에 한 번 계산)."""
+    if attempts < 1:
+        raise ValueError("attempts must be >= 1")
+    sched = _backoff_schedule(attempts, base, cap)
+
+    def decorate(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kw: Any) -> T:
+            return await _run_with_schedule(fn, args, kw, sched, exc)
+
+        return wrapper
+
+    return decorate
@@ -1,20 +1,39 @@
 from __future__ import annotations
 
-import sys
 from pathlib import Path
+from typing import Callable
 
+import pytest
 
-def _add_project_root_to_sys_path() -> None:
+from src.crawler.nuri import CrawlConfig, load_cfg
+from src.utils.eventloop import install_fast_event_loop
+from src.utils.paths import workspace_root
+
+
+def pytest_configure(config: pytest.Config) -> None:
     """
-    pytest에서 'src' 패키지를 찾을 수 있도록 프로젝트 루트를 sys.path에 추가.
+    async 테스트도 CLI/UI와 같은 이벤트 루프(uvloop, 설치된 경우)로 실행.
+    - 루프가 만들어지기 전에 정책을 바꿔야 하므로 세션 fixture가 아니라 configure 단계에서 설치.
+    - uvloop이 없거나 Windows면 기본 asyncio 루프 그대로.
+    """
+    install_fast_event_loop()
+
 
-    tests/ 디렉터리 기준으로 한 단계 위(crawling/)가 루트라고 가정한다.
+@pytest.fixture(scope="session")
+def crawl_cfg() -> CrawlConfig:
     """
-    root = Path(__file__).resolve().parent.parent
-    root_str = str(root)
-    if root_str not in sys.path:
-        sys.path.insert(0, root_str)
+    configs/default.json을 세션당 한 번만 읽어 만든 CrawlConfig (load_cfg: orjson + mtime 캐시).
+
+    CrawlConfig는 생성 후 바뀌지 않으므로 테스트 간에 공유해도 안전하다.
+    """
+    return load_cfg(workspace_root() / "configs" / "default.json")
+
 
+@pytest.fixture(scope="session")
+def line_count() -> Callable[[Path], int]:
+    """JSONL 라인 수를 세는 함수 (디코딩 없이 개행 바이트만 센다. 레코드마다 개행으로 끝남)."""
 
-_add_project_root_to_sys_path()
+    def _count(p: Path) -> int:
+        return p.read_bytes().count(b"\n")
 
+    return _count
@@ -1,25 +1,22 @@
-import json
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
 from src.crawler.nuri import CrawlConfig, crawl_once
-from src.utils.paths import ensure_dir, workspace_root
+from src.utils.paths import ensure_dir
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_crawl_once_happy_path(tmp_path: Path) -> None:
+async def test_crawl_once_happy_path(
+    tmp_path: Path, crawl_cfg: CrawlConfig, line_count: Callable[[Path], int]
+) -> None:
     """
     실제 누리장터에 대해 소량 크롤링이 정상 동작하는지 확인하는 통합 테스트.
 
     - 네트워크 / 사이트 변경에 따라 실패할 수 있으므로 integration 마커를 사용한다.
     """
-    root = workspace_root()
-    cfg_path = root / "configs" / "default.json"
-    cfg_dict = json.loads(cfg_path.read_text(encoding="utf-8"))
-    cfg = CrawlConfig.from_dict(cfg_dict)
-
     data_dir = ensure_dir(tmp_path / "data")
     raw_dir = ensure_dir(data_dir / "raw")
     norm_dir = ensure_dir(data_dir / "normalized")
@@ -30,7 +27,7 @@ async def test_crawl_once_happy_path(tmp_path: Path) -> None:
     out_normalized = norm_dir / "notices_test.jsonl"
 
     await crawl_once(
-        cfg=cfg,
+        cfg=crawl_cfg,
         run_id="TEST_RUN",
         out_raw_list=out_raw_list,
         out_normalized=out_normalized,
@@ -48,9 +45,6 @@ async def test_crawl_once_happy_path(tmp_path: Path) -> None:
     assert out_raw_list.exists()
     assert out_normalized.exists()
 
-    raw_lines = out_raw_list.read_text(encoding="utf-8").strip().splitlines()
-    norm_lines = out_normalized.read_text(encoding="utf-8").strip().splitlines()
-
-    assert 1 <= len(raw_lines) <= 3
-    assert 1 <= len(norm_lines) <= 3
+    assert 1 <= line_count(out_raw_list) <= 3
+    assert 1 <= line_count(out_normalized) <= 3
 
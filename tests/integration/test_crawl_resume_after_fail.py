@@ -1,25 +1,23 @@
-import json
 from pathlib import Path
+from typing import Callable
 
 import pytest
+from pytest_mock import MockerFixture
 
 from src.crawler import nuri
 from src.crawler.nuri import CrawlConfig, crawl_once
-from src.utils.paths import ensure_dir, workspace_root
+from src.utils.paths import ensure_dir
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_crawl_resume_after_injected_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_crawl_resume_after_injected_failure(
+    tmp_path: Path, mocker: MockerFixture, crawl_cfg: CrawlConfig, line_count: Callable[[Path], int]
+) -> None:
     """
     의도적으로 상세 진입에서 오류를 발생시킨 뒤,
     같은 state DB로 재실행했을 때 이어서 수집이 가능한지 검증하는 통합 테스트.
     """
-    root = workspace_root()
-    cfg_path = root / "configs" / "default.json"
-    cfg_dict = json.loads(cfg_path.read_text(encoding="utf-8"))
-    cfg = CrawlConfig.from_dict(cfg_dict)
-
     data_dir = ensure_dir(tmp_path / "data")
     raw_dir = ensure_dir(data_dir / "raw")
     norm_dir = ensure_dir(data_dir / "normalized")
@@ -41,11 +39,12 @@ async def test_crawl_resume_after_injected_failure(tmp_path: Path, monkeypatch:
             raise RuntimeError("인위적 네트워크 실패 가정")
         return await original_open_detail(page, item)
 
-    monkeypatch.setattr(nuri, "_open_detail", flaky_open_detail)
+    # 테스트가 끝나면 mocker가 원래 함수로 되돌린다 (2차 실행까지 패치 유지)
+    mocker.patch.object(nuri, "_open_detail", new=flaky_open_detail)
 
     # 1차 실행: crawl_once 내부에서 예외를 잡고 로그/에러 상태만 기록해야 한다.
     await crawl_once(
-        cfg=cfg,
+        cfg=crawl_cfg,
         run_id="TEST_FAILING_RUN",
         out_raw_list=out_raw_list,
         out_normalized=out_normalized,
@@ -63,15 +62,13 @@ async def test_crawl_resume_after_injected_failure(tmp_path: Path, monkeypatch:
     assert call_count["detail"] > 2
 
     # 1차 실행 시점의 결과 라인 수를 기록
-    raw_lines_first = out_raw_list.read_text(encoding="utf-8").strip().splitlines()
-    norm_lines_first = []
-    if out_normalized.exists():
-        norm_lines_first = out_normalized.read_text(encoding="utf-8").strip().splitlines()
+    raw_lines_first = line_count(out_raw_list)
+    norm_lines_first = line_count(out_normalized) if out_normalized.exists() else 0
 
     # 2차 실행: 같은 state_db로 재실행
     # 이미 ok 처리된 공고는 is_processed=True라서 건너뛰고, 나머지를 계속 수집해야 한다.
     await crawl_once(
-        cfg=cfg,
+        cfg=crawl_cfg,
         run_id="TEST_RESUME_RUN",
         out_raw_list=out_raw_list,
         out_normalized=out_normalized,
@@ -89,9 +86,6 @@ async def test_crawl_resume_after_injected_failure(tmp_path: Path, monkeypatch:
     assert out_raw_list.exists()
     assert out_normalized.exists()
 
-    raw_lines_after = out_raw_list.read_text(encoding="utf-8").strip().splitlines()
-    norm_lines_after = out_normalized.read_text(encoding="utf-8").strip().splitlines()
-
-    assert len(raw_lines_after) >= len(raw_lines_first)
-    assert len(norm_lines_after) >= len(norm_lines_first)
+    assert line_count(out_raw_list) >= raw_lines_first
+    assert line_count(out_normalized) >= norm_lines_first
 
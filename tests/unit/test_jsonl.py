@@ -0,0 +1,47 @@
+import asyncio
+from pathlib import Path
+
+import orjson
+
+from src.storage.jsonl import AsyncJsonlWriter, QueuedJsonlWriter
+
+
+def test_async_writer_batches_until_threshold(tmp_path: Path) -> None:
+    """flush_bytes 전에는 파일에 쓰지 않고, 넘으면 한 번에 기록하는지 테스트."""
+    path = tmp_path / "out.jsonl"
+
+    async def run() -> None:
+        async with AsyncJsonlWriter(path, flush_bytes=64, flush_every=1000) as w:
+            await w.write({"i": 0})
+            assert not path.exists()
+            await w.write_many({"i": i, "pad": "x" * 40} for i in range(1, 3))
+            assert len(path.read_bytes().splitlines()) == 3
+            await w.write({"i": 3})
+
+    asyncio.run(run())
+    rows = [orjson.loads(line) for line in path.read_bytes().splitlines()]
+    assert [r["i"] for r in rows] == [0, 1, 2, 3]
+
+
+def test_queued_writer_flush_and_close(tmp_path: Path) -> None:
+    """put/put_many 한 레코드가 flush()/close() 후 순서대로 파일에 남는지 테스트."""
+    path = tmp_path / "out.jsonl"
+
+    async def run() -> None:
+        q = QueuedJsonlWriter(AsyncJsonlWriter(path))
+        q.put({"i": 0})
+        q.put_many([{"i": 1}, {"i": 2}])
+        await q.flush()
+        assert len(path.read_bytes().splitlines()) == 3
+        q.put({"i": 3})
+        await q.close()
+
+    asyncio.run(run())
+    assert [orjson.loads(line)["i"] for line in path.read_bytes().splitlines()] == [0, 1, 2, 3]
+
+
+def test_no_records_no_file(tmp_path: Path) -> None:
+    """기록이 없으면 파일을 만들지 않는지 테스트."""
+    path = tmp_path / "empty.jsonl"
+    asyncio.run(AsyncJsonlWriter(path).close())
+    assert not path.exists()
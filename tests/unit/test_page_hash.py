@@ -0,0 +1,59 @@
+import asyncio
+import json
+import shutil
+import subprocess
+from typing import Any
+
+import pytest
+
+from src.crawler.nuri import _HTML_SHA256_JS, page_content_hash
+from src.storage.state import sha256_text
+
+DOCTYPE = "<!DOCTYPE html>"
+OUTER_HTML = "<html><head></head><body><table><tr><th>공고명</th><td>테스트</td></tr></table></body></html>"
+# Playwright page.content()가 돌려주는 문자열
+PAGE_CONTENT = DOCTYPE + OUTER_HTML
+
+# 최소한의 window/document로 _HTML_SHA256_JS를 node에서 실행 (SubtleCrypto 있음/없음 두 경우)
+_NODE_HARNESS = """
+const [src, doctype, outer] = process.argv.slice(1);
+const fn = eval(src);
+globalThis.XMLSerializer = class { serializeToString(n) { return n.text; } };
+globalThis.document = { doctype: { text: doctype }, documentElement: { outerHTML: outer } };
+(async () => {
+  globalThis.window = { crypto: globalThis.crypto };
+  const withSubtle = await fn();
+  globalThis.window = {};
+  const withoutSubtle = await fn();
+  console.log(JSON.stringify({ withSubtle, withoutSubtle }));
+})();
+"""
+
+
+class _FakePage:
+    def __init__(self, result: Any):
+        self.result = result
+
+    async def evaluate(self, expression: str) -> Any:
+        return self.result
+
+
+def test_page_content_hash_fallback_hashes_page_content() -> None:
+    """SubtleCrypto가 없을 때는 JS가 돌려준 직렬화 문자열을 파이썬에서 해시하는지 테스트."""
+    assert asyncio.run(page_content_hash(_FakePage({"html": PAGE_CONTENT}))) == sha256_text(PAGE_CONTENT)
+    assert asyncio.run(page_content_hash(_FakePage({"digest": "abc"}))) == "abc"
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node 없음")
+def test_browser_and_fallback_hashes_agree() -> None:
+    """브라우저(SubtleCrypto) 해시와 대체 경로 해시가 모두 page.content()(doctype 포함)의 SHA-256과 같은지 테스트."""
+    out = subprocess.run(
+        ["node", "-e", _NODE_HARNESS, _HTML_SHA256_JS, DOCTYPE, OUTER_HTML],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    res = json.loads(out.stdout)
+
+    assert res["withSubtle"] == {"digest": sha256_text(PAGE_CONTENT)}
+    assert res["withoutSubtle"] == {"html": PAGE_CONTENT}
@@ -0,0 +1,92 @@
+import asyncio
+from typing import List
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from src.crawler.nuri import ElementNotFoundError, _wait_any_selector
+from src.utils import retry as retry_mod
+from src.utils.retry import default_retry, retry_async
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """실제로 기다리지 않고 백오프 대기 시간만 기록."""
+    recorded: List[float] = []
+
+    async def _fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(retry_mod.asyncio, "sleep", _fake_sleep)
+    return recorded
+
+
+def test_retry_async_succeeds_after_failures(sleeps: List[float]) -> None:
+    """일시 실패 후 성공하면 결과를 돌려주고, 실패 횟수만큼 백오프한다."""
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ConnectionError("boom")
+        return "ok"
+
+    assert asyncio.run(retry_async(flaky)) == "ok"
+    assert calls == 3
+    assert len(sleeps) == 2
+    # 1차 대기: 1초 기준 0.5~1.5배, 2차 대기: 2초 기준 0.5~1.5배
+    assert 0.5 <= sleeps[0] <= 1.5
+    assert 1.0 <= sleeps[1] <= 3.0
+
+
+def test_default_retry_reraises_last_error(sleeps: List[float]) -> None:
+    """시도 횟수를 다 쓰면 마지막 예외를 그대로 올린다."""
+    calls = 0
+
+    @default_retry(attempts=3)
+    async def always_fails() -> None:
+        nonlocal calls
+        calls += 1
+        raise ConnectionError(f"fail {calls}")
+
+    with pytest.raises(ConnectionError, match="fail 3"):
+        asyncio.run(always_fails())
+    assert calls == 3
+    assert len(sleeps) == 2
+
+
+def test_non_transient_error_is_not_retried(sleeps: List[float]) -> None:
+    """일시 오류가 아닌 예외(프로그래밍/설정 오류)는 재시도 없이 바로 올린다."""
+    calls = 0
+
+    @default_retry()
+    async def broken() -> None:
+        nonlocal calls
+        calls += 1
+        raise ValueError("bad config")
+
+    with pytest.raises(ValueError):
+        asyncio.run(broken())
+    assert calls == 1
+    assert sleeps == []
+
+
+def test_selector_miss_is_not_retried(sleeps: List[float]) -> None:
+    """후보 셀렉터를 모두 놓친 경우(설정 오류)는 내부 Playwright 시간 초과와 달리 재시도하지 않는다."""
+    calls = 0
+
+    class _Page:
+        async def wait_for_selector(self, sel: str, timeout: int) -> None:
+            nonlocal calls
+            calls += 1
+            raise PlaywrightTimeoutError(f"timeout: {sel}")
+
+    @default_retry()
+    async def wait_ready() -> str:
+        return await _wait_any_selector(_Page(), ["#a", "#b"], timeout_ms=10)
+
+    with pytest.raises(ElementNotFoundError):
+        asyncio.run(wait_ready())
+    assert calls == 2
+    assert sleeps == []
@@ -0,0 +1,41 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from src.crawler import nuri
+from src.crawler.nuri import SharedBrowser
+
+
+class _FakeBrowser:
+    def is_connected(self) -> bool:
+        return True
+
+
+def test_concurrent_get_launches_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """동시에 불린 get()(예열 + 크롤링)이 Playwright/Chromium을 한 번만 띄우는지 테스트."""
+    starts: List[int] = []
+    launches: List[_FakeBrowser] = []
+
+    class _FakePlaywrightCM:
+        async def start(self) -> Any:
+            starts.append(1)
+            await asyncio.sleep(0)
+            return object()
+
+    async def _fake_launch(pw: Any, headless: bool, debug_slowmo_ms: int = 0) -> _FakeBrowser:
+        await asyncio.sleep(0)
+        launches.append(_FakeBrowser())
+        return launches[-1]
+
+    monkeypatch.setattr(nuri, "async_playwright", _FakePlaywrightCM)
+    monkeypatch.setattr(nuri, "launch_browser", _fake_launch)
+
+    async def run() -> List[Any]:
+        shared = SharedBrowser()
+        return await asyncio.gather(shared.get(), shared.get())
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert len(starts) == 1
+    assert len(launches) == 1
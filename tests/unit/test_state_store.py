@@ -1,8 +1,21 @@
+import sqlite3
 from pathlib import Path
+from typing import Iterator
 
+import orjson
+import pytest
+
+from src.storage import state as state_mod
 from src.storage.state import StateStore, sha256_text
 
 
+@pytest.fixture(autouse=True)
+def _close_stores() -> Iterator[None]:
+    """StateStore는 경로별로 연결을 공유하므로, 테스트마다 열린 연결을 모두 닫는다."""
+    yield
+    StateStore.close_all()
+
+
 def test_checkpoint_roundtrip(tmp_path: Path) -> None:
     """체크포인트 저장/조회가 올바르게 동작하는지 테스트."""
     db_path = tmp_path / "state.sqlite"
@@ -15,7 +28,8 @@ def test_checkpoint_roundtrip(tmp_path: Path) -> None:
     store.set_checkpoint("bid_list.page", "3")
     assert store.get_checkpoint("bid_list.page") == "3"
 
-    # 새 인스턴스로 다시 열어도 값이 유지되는지 확인
+    # 닫고 새로 열어도 값이 유지되는지 확인
+    store.close()
     store2 = StateStore(db_path)
     assert store2.get_checkpoint("bid_list.page") == "3"
 
@@ -56,9 +70,180 @@ def test_resume_after_failure_uses_checkpoint(tmp_path: Path) -> None:
     # 1차 실행: 1~2페이지 처리 후 3페이지에서 재시작하도록 체크포인트 저장했다고 가정
     store1 = StateStore(db_path)
     store1.set_checkpoint("bid_list.page", "3")
+    store1.close()
 
     # 2차 실행: 같은 DB로 새 StateStore 생성 시, 3페이지부터 시작해야 함
     store2 = StateStore(db_path)
     start_page = int(store2.get_checkpoint("bid_list.page") or "1")
     assert start_page == 3
 
+
+
+def test_mark_seen_batch(tmp_path: Path) -> None:
+    """여러 공고를 한 번에 seen 으로 기록하고, 이미 ok 인 공고의 상태는 유지되는지 테스트."""
+    store = StateStore(tmp_path / "state.sqlite")
+    store.upsert_processed("n1", "ok", "2026-02-08T10:00:00Z", content_hash="h1")
+
+    store.mark_seen_batch([("n1", "2026-02-08T11:00:00Z"), ("n2", "2026-02-08T11:00:00Z")])
+
+    assert store.is_processed("n1") is True
+    assert store.get_content_hash("n1") == "h1"
+    assert store.is_processed("n2") is False
+    assert store.get_content_hash("n2") is None
+
+
+def test_load_processed_ids_only_ok(tmp_path: Path) -> None:
+    """load_processed_ids 는 ok 상태 공고만 돌려주는지 테스트."""
+    store = StateStore(tmp_path / "state.sqlite")
+    store.mark_seen("seen-only", "2026-02-08T10:00:00Z")
+    store.upsert_processed("done", "ok", "2026-02-08T10:00:00Z", content_hash="h")
+    store.upsert_processed("failed", "error", "2026-02-08T10:00:00Z")
+
+    assert store.load_processed_ids() == {"done"}
+
+
+def test_batch_commits_together_and_rolls_back(tmp_path: Path) -> None:
+    """batch() 안의 쓰기는 함께 커밋되고, 예외 시 모두 롤백되는지 테스트 (중첩 batch 포함)."""
+    db_path = tmp_path / "state.sqlite"
+    store = StateStore(db_path)
+
+    with store.batch():
+        store.upsert_processed("n1", "ok", "2026-02-08T10:00:00Z", content_hash="h1")
+        with store.batch():
+            store.mark_seen_batch([("n2", "2026-02-08T10:00:00Z")])
+        store.set_checkpoint("bid_list.page", "2")
+
+    # 커밋된 내용이 다른 연결에서도 보이는지 별도 sqlite3 연결로 확인
+    other = sqlite3.connect(db_path)
+    try:
+        assert other.execute("SELECT status FROM processed WHERE notice_id = 'n1'").fetchone() == ("ok",)
+        assert other.execute("SELECT status FROM processed WHERE notice_id = 'n2'").fetchone() == ("seen",)
+        assert other.execute(
+            "SELECT value FROM checkpoint_delta WHERE key = 'bid_list.page' ORDER BY ts DESC LIMIT 1"
+        ).fetchone() == ("2",)
+    finally:
+        other.close()
+
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.upsert_processed("n3", "ok", "2026-02-08T10:00:00Z")
+            store.set_checkpoint("bid_list.page", "3")
+            raise RuntimeError("중간 실패")
+
+    assert store.is_processed("n3") is False
+    assert store.get_checkpoint("bid_list.page") == "2"
+
+
+def test_checkpoint_deltas_and_compaction(tmp_path: Path) -> None:
+    """체크포인트는 delta로 쌓이고, 압축 후에도 최신값/순서가 유지되는지 테스트."""
+    db_path = tmp_path / "state.sqlite"
+    store = StateStore(db_path)
+
+    for page in ("1", "2", "3"):
+        store.set_checkpoint("bid_list.page", page)
+    store.set_checkpoint("bid_list.url", "https://example.com/list")
+    assert store.get_checkpoint("bid_list.page") == "3"
+    delta_rows = store.conn.execute("SELECT COUNT(*) FROM checkpoint_delta").fetchone()[0]
+    assert delta_rows == 4
+
+    store.compact_checkpoints()
+    assert store.conn.execute("SELECT COUNT(*) FROM checkpoint_delta").fetchone()[0] == 0
+    assert store.get_checkpoint("bid_list.page") == "3"
+    assert store.get_checkpoint("bid_list.url") == "https://example.com/list"
+
+    # 압축 뒤 새 delta가 스냅샷보다 우선하고, ts는 압축 시점 다음부터 이어진다
+    store.set_checkpoint("bid_list.page", "4")
+    assert store.get_checkpoint("bid_list.page") == "4"
+    assert store.conn.execute("SELECT MIN(ts) FROM checkpoint_delta").fetchone()[0] == 5
+
+    store.close()
+    reopened = StateStore(db_path)
+    assert reopened is not store
+    assert reopened.get_checkpoint("bid_list.page") == "4"
+
+
+def test_checkpoint_auto_compaction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """delta가 임계치만큼 쌓이면 자동으로 스냅샷으로 압축되는지 테스트."""
+    monkeypatch.setattr(state_mod, "CHECKPOINT_COMPACT_EVERY", 3)
+    store = StateStore(tmp_path / "state.sqlite")
+
+    for page in range(1, 4):
+        store.set_checkpoint("bid_list.page", str(page))
+
+    assert store.conn.execute("SELECT COUNT(*) FROM checkpoint_delta").fetchone()[0] == 0
+    assert store.get_checkpoint("bid_list.page") == "3"
+
+
+def test_mark_error_keeps_previous_hash(tmp_path: Path) -> None:
+    """mark_error 는 처리 완료 표시를 해제하되, 이전 content_hash 는 남기는지 테스트."""
+    store = StateStore(tmp_path / "state.sqlite")
+    store.upsert_processed("n1", "ok", "2026-02-08T10:00:00Z", content_hash="h1")
+
+    store.mark_error("n1", "2026-02-09T10:00:00Z")
+
+    assert store.is_processed("n1") is False
+    assert store.get_content_hash("n1") == "h1"
+
+
+def test_same_path_shares_one_store(tmp_path: Path) -> None:
+    """같은 DB 경로는 같은 인스턴스(연결)를 돌려주고, close() 뒤에는 새로 여는지 테스트."""
+    db_path = tmp_path / "state.sqlite"
+    store = StateStore(db_path)
+    assert StateStore(str(db_path)) is store
+
+    store.set_checkpoint("bid_list.page", "5")
+    store.close()
+
+    reopened = StateStore(db_path)
+    assert reopened is not store
+    assert reopened.get_checkpoint("bid_list.page") == "5"
+    reopened.close()
+
+
+def test_rollback_resyncs_ok_ids(tmp_path: Path) -> None:
+    """batch()가 롤백되면 그 안에서 바꾼 ok 표시가 load_processed_ids/is_processed에 남지 않는지 테스트."""
+    store = StateStore(tmp_path / "state.sqlite")
+    store.upsert_processed("n0", "ok", "2026-02-08T09:00:00Z", content_hash="h0")
+
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.upsert_processed("n1", "ok", "2026-02-08T10:00:00Z", content_hash="h1")
+            store.mark_error("n0", "2026-02-08T10:00:00Z")
+            raise RuntimeError("중간 실패")
+
+    assert store.load_processed_ids() == {"n0"}
+    assert store.is_processed("n1") is False
+    assert store.is_processed("n0") is True
+    assert store.is_processed("never-seen") is False
+
+
+def test_errors_batched_and_exported(tmp_path: Path) -> None:
+    """오류 행이 ERROR_BATCH_SIZE 단위로 기록되고, 회차별 JSONL로 내보내지는지 테스트."""
+    store = StateStore(tmp_path / "state.sqlite")
+
+    def _count() -> int:
+        return store.conn.execute("SELECT COUNT(*) FROM errors").fetchone()[0]
+
+    for i in range(state_mod.ERROR_BATCH_SIZE - 1):
+        store.add_error("2026-02-08T10:00:00Z", "run1", f"n{i}", "TimeoutError", "timeout", url="https://x")
+    assert _count() == 0
+
+    store.add_error("2026-02-08T10:00:00Z", "run1", "last", "ValueError", "bad", traceback="tb")
+    assert _count() == state_mod.ERROR_BATCH_SIZE
+
+    store.add_error("2026-02-09T10:00:00Z", "run2", "other", "ValueError", "bad")
+    assert store.export_errors(tmp_path / "errors", "none") is None
+
+    out = store.export_errors(tmp_path / "errors", "run2")
+    assert out == tmp_path / "errors" / "errors_run2.jsonl"
+    lines = out.read_bytes().splitlines()
+    assert len(lines) == 1
+    assert orjson.loads(lines[0]) == {
+        "ts": "2026-02-09T10:00:00Z",
+        "run_id": "run2",
+        "notice_id": "other",
+        "kind": "ValueError",
+        "message": "bad",
+        "traceback": None,
+        "url": None,
+    }